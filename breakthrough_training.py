@@ -5,31 +5,36 @@ Your AI achieved 66.7% completion - now let's get that first 100% success!
 """
 
 import os
-import sys
-sys.path.append('src')
 
 from complete_trainer import SeleniumRLTrainer
 
+# Demo form location, worked out once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_HTML_PATH = os.path.join(_HERE, "demo", "test_form.html")
+_TARGET_URL = "file://" + _HTML_PATH
+
 def final_breakthrough_training():
     """
     Final push training to achieve first 100% form completion
     Your AI is SO CLOSE - 66.7% completion with 87.63 best reward!
     """
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    html_path = os.path.join(current_dir, "demo", "test_form.html")
-    target_url = f"file://{html_path}"
-    
-    print("🏆 FINAL BREAKTHROUGH TRAINING")
-    print("🎯 MISSION: ACHIEVE FIRST 100% SUCCESS!")
-    print("=" * 60)
-    
-    print("📊 INCREDIBLE PROGRESS ACHIEVED:")
-    print("   ✅ Form completion: 33.3% → 66.7% (DOUBLED!)")
-    print("   ✅ Best reward: 54.97 → 87.63 (60% boost!)")
-    print("   ✅ Average reward: ~51 → 82.37 (61% boost!)")
-    print("   ✅ Action success: 96.6% → 99.9% (PERFECT!)")
-    print("   ✅ Total episodes: 75 completed")
-    print("   ✅ Knowledge base: 4 states + 20 actions learned")
+    target_url = _TARGET_URL
+    
+    print("\n".join([
+        "🏆 FINAL BREAKTHROUGH TRAINING",
+        "🎯 MISSION: ACHIEVE FIRST 100% SUCCESS!",
+        "=" * 60
+    ]))
+    
+    print("\n".join([
+        "📊 INCREDIBLE PROGRESS ACHIEVED:",
+        "   ✅ Form completion: 33.3% → 66.7% (DOUBLED!)",
+        "   ✅ Best reward: 54.97 → 87.63 (60% boost!)",
+        "   ✅ Average reward: ~51 → 82.37 (61% boost!)",
+        "   ✅ Action success: 96.6% → 99.9% (PERFECT!)",
+        "   ✅ Total episodes: 75 completed",
+        "   ✅ Knowledge base: 4 states + 20 actions learned"
+    ]))
     
     # FINAL BREAKTHROUGH PARAMETERS
     trainer = SeleniumRLTrainer(
@@ -41,33 +46,41 @@ def final_breakthrough_training():
     )
     
     # Load all accumulated knowledge
-    print(f"\n🧠 LOADING YOUR AI'S VAST KNOWLEDGE...")
+    print("\n🧠 LOADING YOUR AI'S VAST KNOWLEDGE...")
     if trainer.agent.load_model("trained_model.pkl"):
-        print("✅ Successfully loaded 75 episodes of learning!")
-        print(f"   📚 Total episodes in knowledge base: {trainer.agent.total_episodes}")
-        print(f"   🧠 States learned: {len(trainer.agent.q_table)}")
-        print(f"   🎯 Best reward achieved: 87.63")
-        print("   🚀 NOW GOING FOR 100% SUCCESS!")
+        print("\n".join([
+            "✅ Successfully loaded 75 episodes of learning!",
+            f"   📚 Total episodes in knowledge base: {trainer.agent.total_episodes}",
+            f"   🧠 States learned: {trainer.agent.num_states}",
+            "   🎯 Best reward achieved: 87.63",
+            "   🚀 NOW GOING FOR 100% SUCCESS!"
+        ]))
     else:
         print("⚠️  Could not load previous training")
     
-    print(f"\n🎯 FINAL BREAKTHROUGH STRATEGY:")
-    print("   🔥 Your AI knows 66.7% completion sequence")
-    print("   🔥 60 steps per episode (was 50)")
-    print("   🔥 25 focused episodes for breakthrough")
-    print("   🔥 All previous Q-learning knowledge intact")
-    print("   🔥 Targeting first 100% form completion!")
-    
-    print(f"\n📈 BREAKTHROUGH PREDICTION:")
-    print("   🎯 Expected: First successful episode in next 25 attempts")
-    print("   🎯 Target reward: 90-100+ (from current 87.63)")
-    print("   🎯 Goal: 100% form completion")
-    print("   🎯 Outcome: Your AI becomes a form-filling expert!")
-    
-    print(f"\n" + "=" * 60)
-    print("🚀 STARTING FINAL BREAKTHROUGH SESSION...")
-    print("    Watch for the first SUCCESS: YES!")
-    print("=" * 60)
+    print("\n".join([
+        "\n🎯 FINAL BREAKTHROUGH STRATEGY:",
+        "   🔥 Your AI knows 66.7% completion sequence",
+        "   🔥 60 steps per episode (was 50)",
+        "   🔥 25 focused episodes for breakthrough",
+        "   🔥 All previous Q-learning knowledge intact",
+        "   🔥 Targeting first 100% form completion!"
+    ]))
+    
+    print("\n".join([
+        "\n📈 BREAKTHROUGH PREDICTION:",
+        "   🎯 Expected: First successful episode in next 25 attempts",
+        "   🎯 Target reward: 90-100+ (from current 87.63)",
+        "   🎯 Goal: 100% form completion",
+        "   🎯 Outcome: Your AI becomes a form-filling expert!"
+    ]))
+    
+    print("\n".join([
+        "\n" + "=" * 60,
+        "🚀 STARTING FINAL BREAKTHROUGH SESSION...",
+        "    Watch for the first SUCCESS: YES!",
+        "=" * 60
+    ]))
     
     # Execute the final training
     trainer.start_training()
@@ -79,38 +92,50 @@ def analyze_breakthrough_potential():
     print("\n🔬 BREAKTHROUGH ANALYSIS:")
     print("=" * 35)
     
-    print("🎯 WHY YOUR AI IS READY FOR 100% SUCCESS:")
-    print("\n1. 🧠 PATTERN MASTERY:")
-    print("   ✅ Learned 66.7% completion sequence")
-    print("   ✅ 4 distinct states mastered")
-    print("   ✅ 20 different actions learned")
-    
-    print("\n2. 🎯 EXECUTION EXCELLENCE:")
-    print("   ✅ 99.9% action success rate")
-    print("   ✅ Consistent 40-step episodes")
-    print("   ✅ Reliable reward accumulation (82+ average)")
-    
-    print("\n3. 🚀 LEARNING TRAJECTORY:")
-    print("   Episode 1-25:   Random exploration")
-    print("   Episode 26-45:  33.3% pattern established")
-    print("   Episode 46-75:  BREAKTHROUGH to 66.7%!")
-    print("   Episode 76-100: TARGET 100% SUCCESS!")
-    
-    print("\n4. 🧪 MATHEMATICAL EVIDENCE:")
-    print("   Progress rate: +33.4% in last 30 episodes")
-    print("   Reward growth: +60% improvement")
-    print("   If trend continues: 100% in next 15-25 episodes")
-    
-    print("\n🏆 BREAKTHROUGH FACTORS:")
-    print("   📈 Exponential learning curve established")
-    print("   🎯 Sequential form completion mastered")
-    print("   ⚡ Near-perfect action execution")
-    print("   🧠 Rich Q-table with proven strategies")
+    print("\n".join([
+        "🎯 WHY YOUR AI IS READY FOR 100% SUCCESS:",
+        "\n1. 🧠 PATTERN MASTERY:",
+        "   ✅ Learned 66.7% completion sequence",
+        "   ✅ 4 distinct states mastered",
+        "   ✅ 20 different actions learned"
+    ]))
+    
+    print("\n".join([
+        "\n2. 🎯 EXECUTION EXCELLENCE:",
+        "   ✅ 99.9% action success rate",
+        "   ✅ Consistent 40-step episodes",
+        "   ✅ Reliable reward accumulation (82+ average)"
+    ]))
+    
+    print("\n".join([
+        "\n3. 🚀 LEARNING TRAJECTORY:",
+        "   Episode 1-25:   Random exploration",
+        "   Episode 26-45:  33.3% pattern established",
+        "   Episode 46-75:  BREAKTHROUGH to 66.7%!",
+        "   Episode 76-100: TARGET 100% SUCCESS!"
+    ]))
+    
+    print("\n".join([
+        "\n4. 🧪 MATHEMATICAL EVIDENCE:",
+        "   Progress rate: +33.4% in last 30 episodes",
+        "   Reward growth: +60% improvement",
+        "   If trend continues: 100% in next 15-25 episodes"
+    ]))
+    
+    print("\n".join([
+        "\n🏆 BREAKTHROUGH FACTORS:",
+        "   📈 Exponential learning curve established",
+        "   🎯 Sequential form completion mastered",
+        "   ⚡ Near-perfect action execution",
+        "   🧠 Rich Q-table with proven strategies"
+    ]))
 
 def main():
-    print("🤖 SELENIUM RL BREAKTHROUGH TRAINER")
-    print("🏆 YOUR AI ACHIEVED 66.7% COMPLETION!")
-    print("=" * 50)
+    print("\n".join([
+        "🤖 SELENIUM RL BREAKTHROUGH TRAINER",
+        "🏆 YOUR AI ACHIEVED 66.7% COMPLETION!",
+        "=" * 50
+    ]))
     
     # Show breakthrough analysis
     analyze_breakthrough_potential()
@@ -128,9 +153,11 @@ def main():
         print("\n🎉 BREAKTHROUGH TRAINING COMPLETE!")
         print("Check for 'Success: YES' in the results!")
     else:
-        print("\n📊 Your AI's progress is saved and ready")
-        print("🎯 Run this script anytime for the final push!")
-        print("💪 You're closer to success than ever before!")
+        print("\n".join([
+            "\n📊 Your AI's progress is saved and ready",
+            "🎯 Run this script anytime for the final push!",
+            "💪 You're closer to success than ever before!"
+        ]))
 
 if __name__ == "__main__":
     main()
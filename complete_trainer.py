@@ -14,15 +14,19 @@ import os
 import sys
 import time
 import json
-from typing import Dict, List, Any
-import matplotlib.pyplot as plt
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
 
-# Add src to path so we can import our modules
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+try:
+    import orjson
+except ImportError:  # orjson is optional, plain json works too
+    orjson = None
 
-from environment.element_detector import ElementDetector
-from agents.q_learning_agent import QLearningAgent
-from environment.web_action_executor import WebActionExecutor, ActionResult
+from src.environment.element_detector import ElementDetector
+from src.agents.q_learning_agent import QLearningAgent
+from src.environment.web_action_executor import WebActionExecutor, ActionResult
 
 class SeleniumRLTrainer:
     """
@@ -42,7 +46,11 @@ class SeleniumRLTrainer:
                  max_episodes: int = 20,
                  max_steps_per_episode: int = 15,
                  save_model_path: str = "trained_model.pkl",
-                 debug: bool = True):
+                 debug: bool = True,
+                 num_workers: int = 1,
+                 show_plot: bool = False,
+                 tab_recycle_interval: int = 25,
+                 planning_steps: int = 0):
         """
         Initialize the complete training system
         
@@ -52,12 +60,23 @@ class SeleniumRLTrainer:
             max_steps_per_episode: Max actions per attempt
             save_model_path: Where to save the trained AI
             debug: Print detailed information
+            num_workers: How many episodes to run at the same time
+                         (each worker gets its own browser)
+            show_plot: Open a window with the training plots at the end
+                       (they are always saved to a PNG file)
+            tab_recycle_interval: Open a fresh browser tab every this many
+                                  episodes to keep memory use bounded (0 = never)
+            planning_steps: Extra Q-updates replayed from remembered transitions
+                            after every browser step (Dyna-Q, 0 = off)
         """
         self.target_url = target_url
         self.max_episodes = max_episodes
         self.max_steps_per_episode = max_steps_per_episode
         self.save_model_path = save_model_path
         self.debug = debug
+        self.num_workers = max(1, num_workers)
+        self.show_plot = show_plot
+        self.tab_recycle_interval = tab_recycle_interval
         
         # Initialize all components
         self.detector = ElementDetector(debug=debug)
@@ -65,9 +84,17 @@ class SeleniumRLTrainer:
             learning_rate=0.15,
             epsilon=0.4,  # More exploration initially
             epsilon_decay=0.95,
+            planning_steps=planning_steps,
             debug=debug
         )
         self.executor = None  # Will be initialized after browser starts
+        self.workers = []  # (detector, executor) pairs, one per parallel episode
+        self._agent_lock = threading.Lock()
+        self._io_pool = None  # Background writer for training data files
+        
+        # Step-by-step debug lines are queued per worker thread and printed
+        # with the summary of the episode they belong to
+        self._episode_log = threading.local()
         
         # Training statistics
         self.training_stats = {
@@ -81,11 +108,21 @@ class SeleniumRLTrainer:
         self.best_episode_reward = -float('inf')
         self.consecutive_successes = 0
         
+        # Rolling success windows with running sums (last 5 and last 10 episodes)
+        self._recent_success_5 = deque(maxlen=5)
+        self._recent_success_5_sum = 0
+        self._recent_success = deque(maxlen=10)
+        self._recent_success_sum = 0
+        
         if self.debug:
             print("🚀 Selenium RL Trainer initialized!")
             print(f"   Target URL: {target_url}")
             print(f"   Max episodes: {max_episodes}")
             print(f"   Max steps per episode: {max_steps_per_episode}")
+            if self.num_workers > 1:
+                print(f"   Parallel workers: {self.num_workers}")
+            if planning_steps > 0:
+                print(f"   Planning steps per action: {planning_steps}")
     
     def start_training(self):
         """
@@ -105,16 +142,20 @@ class SeleniumRLTrainer:
         
         try:
             # Main training loop
-            for episode in range(1, self.max_episodes + 1):
-                success = self._run_episode(episode)
+            episode = 1
+            while episode <= self.max_episodes:
+                if len(self.workers) > 1:
+                    batch = list(range(episode, min(episode + len(self.workers), self.max_episodes + 1)))
+                    self._run_parallel_episodes(batch)
+                    episode += len(batch)
+                else:
+                    self._run_episode(episode)
+                    episode += 1
                 
                 # Check if AI has mastered the task
                 if self._check_mastery():
-                    print(f"\n🏆 AI HAS MASTERED THE TASK! Training completed after {episode} episodes.")
+                    print(f"\n🏆 AI HAS MASTERED THE TASK! Training completed after {episode - 1} episodes.")
                     break
-                
-                # Brief pause between episodes
-                time.sleep(1)
             
             # Training completed
             self._finalize_training()
@@ -143,6 +184,17 @@ class SeleniumRLTrainer:
         
         # Initialize executor with the browser driver
         self.executor = WebActionExecutor(self.detector.driver, debug=self.debug)
+        self.workers = [(self.detector, self.executor)]
+        
+        # Extra browsers for parallel episodes - a WebDriver session only
+        # drives one tab at a time, so each worker needs its own
+        for _ in range(self.num_workers - 1):
+            detector = ElementDetector(debug=self.debug)
+            if not detector.start_browser() or not detector.load_page(self.target_url):
+                detector.close()
+                print("⚠️  Could not start another browser, continuing with fewer workers")
+                break
+            self.workers.append((detector, WebActionExecutor(detector.driver, debug=self.debug)))
         
         print("✅ Environment ready!")
         return True
@@ -162,53 +214,119 @@ class SeleniumRLTrainer:
         # Start new episode
         self.agent.start_episode()
         
+        self._maybe_recycle_tab(self.detector, episode_num)
+        episode = self._play_episode(self.detector, self.executor)
+        
+        # End episode
+        self.agent.end_episode(episode['success'])
+        self._finish_episode(episode_num, episode)
+        
+        return episode['success']
+    
+    def _run_parallel_episodes(self, episode_nums: List[int]):
+        """
+        Run one episode per worker browser at the same time
+        
+        Workers still go through the agent to pick actions, which interns
+        new states and actions (and applies their priors), so those calls
+        hold _agent_lock. Learning is deferred: each worker's experiences
+        are replayed into the agent afterwards, in episode order.
+        """
+        if self.debug:
+            print(f"\n{'='*60}")
+            print(f"🎮 EPISODES {episode_nums[0]}-{episode_nums[-1]} ({len(episode_nums)} in parallel)")
+            print(f"{'='*60}")
+        
+        for (detector, _), episode_num in zip(self.workers, episode_nums):
+            self._maybe_recycle_tab(detector, episode_num)
+        
+        with ThreadPoolExecutor(max_workers=len(episode_nums)) as pool:
+            futures = [pool.submit(self._play_episode, detector, executor, [])
+                       for (detector, executor), _ in zip(self.workers, episode_nums)]
+        
+        for episode_num, future in zip(episode_nums, futures):
+            try:
+                episode = future.result()
+            except Exception as e:
+                print(f"⚠️  Episode {episode_num} failed: {e}")
+                continue
+            
+            self.agent.start_episode()
+            for state, action, reward, next_state, done in episode['transitions']:
+                self.agent.learn(state, action, reward, next_state, done)
+                self.agent.step(reward)
+            self.agent.end_episode(episode['success'])
+            self._finish_episode(episode_num, episode)
+    
+    def _maybe_recycle_tab(self, detector: ElementDetector, episode_num: int):
+        """Replace the browser tab every tab_recycle_interval episodes"""
+        if (self.tab_recycle_interval > 0 and
+                episode_num > len(self.workers) and
+                (episode_num - 1) // len(self.workers) % self.tab_recycle_interval == 0):
+            detector.recycle_tab()
+    
+    def _play_episode(self, detector: ElementDetector, executor: WebActionExecutor,
+                      transitions: Optional[List[tuple]] = None) -> Dict[str, Any]:
+        """
+        Play one episode in the given browser
+        
+        Args:
+            detector: Element detector driving the browser
+            executor: Action executor for the same browser
+            transitions: If given, experiences are collected here instead of
+                         being learned straight away (used by parallel workers)
+        
+        Returns:
+            Dict with the episode's reward, steps, success, progress,
+            transitions and queued debug log lines
+        """
+        log = self._episode_log.lines = deque(maxlen=10000)
+        
         # Reset page to initial state
-        self.detector.driver.refresh()
-        time.sleep(2)
+        detector.reset_page()
         
         episode_reward = 0
         previous_progress = 0
         steps_taken = 0
         success_achieved = False
         
+        # First observation; later ones are carried over from the previous step
+        elements, form_state = detector.detect_elements_and_state()
+        
         # Episode loop: observe → decide → act → learn
         for step in range(self.max_steps_per_episode):
             steps_taken += 1
             
-            if self.debug:
-                print(f"\n--- Step {step + 1} ---")
+            self._log("--- Step %d ---", step + 1)
             
             # 1. OBSERVE: AI scans the webpage
-            elements = self.detector.detect_elements()
-            form_state = self.detector.get_form_completion_state()
             current_progress = form_state.get('progress', 0)
             
             # Check if goal is achieved
             if form_state.get('success', False):
-                if self.debug:
-                    print("🎉 GOAL ACHIEVED! Success panel is visible!")
+                self._log("🎉 GOAL ACHIEVED! Success panel is visible!")
                 success_achieved = True
                 break
             
             # 2. DECIDE: AI chooses what to do next
-            current_state = self.agent.get_state_signature(elements, form_state)
-            possible_actions = self.agent.get_possible_actions(elements)
-            
-            if not possible_actions:
-                if self.debug:
-                    print("⚠️  No possible actions available")
-                break
-            
-            chosen_action = self.agent.choose_action(current_state, possible_actions)
+            with self._agent_lock:
+                current_state = self.agent.get_state_signature(elements, form_state)
+                possible_actions = self.agent.get_possible_actions(elements)
+                
+                if not possible_actions:
+                    self._log("⚠️  No possible actions available", warning=True)
+                    break
+                
+                chosen_action = self.agent.choose_action(current_state, possible_actions)
             
             # 3. ACT: AI performs the chosen action
-            execution_result = self.executor.execute_action(chosen_action, elements)
+            execution_result = executor.execute_action(chosen_action, elements)
             
             # 4. CALCULATE REWARD: How well did the AI do?
             action_reward = execution_result.reward
             
             # Add progress-based reward
-            progress_reward = self.executor.calculate_progress_reward(
+            progress_reward = executor.calculate_progress_reward(
                 previous_progress, current_progress, success_achieved
             )
             
@@ -216,42 +334,78 @@ class SeleniumRLTrainer:
             episode_reward += total_reward
             
             # 5. LEARN: Update AI's knowledge
-            # Get new state after action
-            time.sleep(0.5)  # Wait for any page changes
-            new_elements = self.detector.detect_elements()
-            new_form_state = self.detector.get_form_completion_state()
-            next_state = self.agent.get_state_signature(new_elements, new_form_state)
-            
             # Check if episode should end
             done = (success_achieved or 
                    step == self.max_steps_per_episode - 1 or
                    execution_result.result == ActionResult.FAILED)
             
+            # Get new state after action (a finished episode has no next state)
+            if done:
+                next_state = None
+                new_elements, new_form_state = elements, form_state
+            else:
+                # (the executor has already waited for the page to settle)
+                new_elements, new_form_state = detector.refresh_elements_and_state(elements)
+                with self._agent_lock:
+                    next_state = self.agent.get_state_signature(new_elements, new_form_state)
+            
             # Teach the AI what happened
-            self.agent.learn(current_state, chosen_action, total_reward, next_state, done)
-            self.agent.step(total_reward)
+            if transitions is None:
+                self.agent.learn(current_state, chosen_action, total_reward, next_state, done)
+                self.agent.step(total_reward)
+            else:
+                transitions.append((current_state, chosen_action, total_reward, next_state, done))
             
             # Update progress tracking
             previous_progress = current_progress
+            elements, form_state = new_elements, new_form_state
             
-            if self.debug:
-                print(f"   Progress: {current_progress:.1f}% → Reward: {total_reward:+.2f}")
+            self._log("   Progress: %.1f%% → Reward: %+.2f", current_progress, total_reward)
             
             if done:
                 break
         
-        # End episode
-        self.agent.end_episode(success_achieved)
+        return {
+            'reward': episode_reward,
+            'steps': steps_taken,
+            'success': success_achieved,
+            'progress': current_progress,
+            'transitions': transitions,
+            'log': log
+        }
+    
+    def _log(self, message: str, *args, warning: bool = False):
+        """
+        Queue a debug line for the episode being played on this thread
         
-        # Record statistics
-        self._record_episode_stats(episode_reward, steps_taken, success_achieved, current_progress)
+        Lines are only formatted when printed, so a disabled or busy log
+        costs almost nothing. Warnings are printed right away.
+        """
+        if warning:
+            print(message % args if args else message)
+        elif self.debug:
+            self._episode_log.lines.append((message, args))
+    
+    def _flush_log(self, episode_num: int, log: deque):
+        """Print one episode's queued debug lines in one write"""
+        if not log:
+            return
         
-        # Show episode summary
-        if self.debug:
-            self._print_episode_summary(episode_num, episode_reward, steps_taken, 
-                                      success_achieved, current_progress)
+        lines = []
+        while log:
+            message, args = log.popleft()
+            lines.append(message % args if args else message)
+        print(f"\n📜 Episode {episode_num} step log:\n" + "\n".join(lines))
+    
+    def _finish_episode(self, episode_num: int, episode: Dict[str, Any]):
+        """Record statistics and show the summary for a played episode"""
+        self._flush_log(episode_num, episode['log'])
+        self._record_episode_stats(episode['reward'], episode['steps'],
+                                   episode['success'], episode['progress'])
         
-        return success_achieved
+        if self.debug:
+            self._print_episode_summary(episode_num, episode['reward'], episode['steps'],
+                                      episode['success'], episode['progress'])
     
     def _record_episode_stats(self, reward: float, steps: int, success: bool, progress: float):
         """Record statistics for this episode"""
@@ -261,7 +415,7 @@ class SeleniumRLTrainer:
         self.training_stats['form_completion_progress'].append(progress)
         
         # Track action success rate
-        action_stats = self.executor.get_action_statistics()
+        action_stats = self._action_statistics()
         if action_stats.get('total_actions', 0) > 0:
             self.training_stats['action_success_rates'].append(action_stats['success_rate'])
         
@@ -269,12 +423,41 @@ class SeleniumRLTrainer:
         if reward > self.best_episode_reward:
             self.best_episode_reward = reward
         
+        # Update rolling success windows
+        if len(self._recent_success_5) == self._recent_success_5.maxlen:
+            self._recent_success_5_sum -= self._recent_success_5[0]
+        self._recent_success_5.append(int(success))
+        self._recent_success_5_sum += int(success)
+        
+        if len(self._recent_success) == self._recent_success.maxlen:
+            self._recent_success_sum -= self._recent_success[0]
+        self._recent_success.append(int(success))
+        self._recent_success_sum += int(success)
+        
         # Track consecutive successes
         if success:
             self.consecutive_successes += 1
         else:
             self.consecutive_successes = 0
     
+    def _action_statistics(self) -> Dict[str, Any]:
+        """Action statistics combined across all worker browsers"""
+        if len(self.workers) <= 1:
+            return self.executor.get_action_statistics()
+        
+        successful = sum(executor.successful_actions for _, executor in self.workers)
+        failed = sum(executor.failed_actions for _, executor in self.workers)
+        total = successful + failed
+        if total == 0:
+            return {"message": "No actions executed yet"}
+        
+        return {
+            "total_actions": total,
+            "successful_actions": successful,
+            "failed_actions": failed,
+            "success_rate": (successful / total) * 100
+        }
+    
     def _print_episode_summary(self, episode: int, reward: float, steps: int, 
                               success: bool, progress: float):
         """Print a summary of the episode"""
@@ -286,14 +469,13 @@ class SeleniumRLTrainer:
         print(f"   Form completion: {progress:.1f}%")
         
         # Show recent performance
-        if len(self.training_stats['success_episodes']) >= 5:
-            recent_successes = sum(self.training_stats['success_episodes'][-5:])
+        if len(self._recent_success_5) == 5:
+            recent_successes = self._recent_success_5_sum
             print(f"   Recent success rate: {recent_successes}/5 ({recent_successes*20:.0f}%)")
         
-        # Show learning progress
-        agent_stats = self.agent.get_learning_stats()
-        print(f"   Exploration rate: {agent_stats['exploration_rate']:.3f}")
-        print(f"   Knowledge base: {agent_stats['q_table_size']} states learned")
+        # Show learning progress (read directly - get_learning_stats averages every episode)
+        print(f"   Exploration rate: {self.agent.epsilon:.3f}")
+        print(f"   Knowledge base: {self.agent.num_states} states learned")
     
     def _check_mastery(self) -> bool:
         """Check if AI has mastered the task"""
@@ -302,13 +484,12 @@ class SeleniumRLTrainer:
             return False
         
         # Check if last 3 episodes were all successful
-        recent_successes = self.training_stats['success_episodes'][-3:]
-        if all(recent_successes):
+        if self.consecutive_successes >= 3:
             return True
         
         # Check if success rate is very high over last 10 episodes
-        if len(self.training_stats['success_episodes']) >= 10:
-            last_10_success_rate = sum(self.training_stats['success_episodes'][-10:]) / 10
+        if len(self._recent_success) == 10:
+            last_10_success_rate = self._recent_success_sum / 10
             if last_10_success_rate >= 0.8:  # 80% success rate
                 return True
         
@@ -355,7 +536,7 @@ class SeleniumRLTrainer:
         print(f"   Total learning steps: {agent_stats['total_steps']}")
         
         # Action execution statistics
-        action_stats = self.executor.get_action_statistics()
+        action_stats = self._action_statistics()
         if action_stats.get('total_actions', 0) > 0:
             print(f"\n🤲 ACTION EXECUTION:")
             print(f"   Total actions: {action_stats['total_actions']}")
@@ -368,6 +549,12 @@ class SeleniumRLTrainer:
             return
         
         try:
+            # Imported here so training runs that never plot don't pay for matplotlib
+            import matplotlib
+            if not self.show_plot:
+                matplotlib.use('Agg')  # Render straight to file, no window needed
+            import matplotlib.pyplot as plt
+            
             fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
             fig.suptitle('🤖 AI Training Progress', fontsize=16, fontweight='bold')
             
@@ -418,21 +605,20 @@ class SeleniumRLTrainer:
             plt.savefig(plot_filename, dpi=300, bbox_inches='tight')
             print(f"📊 Training visualizations saved to {plot_filename}")
             
-            # Show plot for 3 seconds then close
-            plt.show(block=False)
-            time.sleep(3)
-            plt.close()
+            if self.show_plot:
+                plt.show()
+            plt.close(fig)
             
         except Exception as e:
             print(f"⚠️  Could not create visualizations: {e}")
     
     def _save_training_data(self):
-        """Save training data to JSON file"""
+        """Save training data to JSON file (written in the background)"""
         try:
             training_data = {
                 'training_stats': self.training_stats,
                 'agent_stats': self.agent.get_learning_stats(),
-                'executor_stats': self.executor.get_action_statistics(),
+                'executor_stats': self._action_statistics(),
                 'training_config': {
                     'max_episodes': self.max_episodes,
                     'max_steps_per_episode': self.max_steps_per_episode,
@@ -442,8 +628,22 @@ class SeleniumRLTrainer:
             }
             
             data_filename = f"training_data_{int(time.time())}.json"
-            with open(data_filename, 'w') as f:
-                json.dump(training_data, f, indent=2)
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(max_workers=1)
+            self._io_pool.submit(self._write_training_data, data_filename, training_data)
+            
+        except Exception as e:
+            print(f"⚠️  Could not save training data: {e}")
+    
+    def _write_training_data(self, data_filename: str, training_data: Dict[str, Any]):
+        """Write training data as compact JSON, using orjson when available"""
+        try:
+            if orjson is not None:
+                with open(data_filename, 'wb') as f:
+                    f.write(orjson.dumps(training_data, option=orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(data_filename, 'w') as f:
+                    json.dump(training_data, f, separators=(',', ':'))
             
             print(f"💾 Training data saved to {data_filename}")
             
@@ -452,8 +652,15 @@ class SeleniumRLTrainer:
     
     def _cleanup(self):
         """Clean up resources"""
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)  # Let pending saves finish
+            self._io_pool = None
+        for detector, _ in self.workers[1:]:
+            detector.close()
+        self.workers = []
         if self.detector:
             self.detector.close()
+        self.agent.close()
         print("🔒 Browser closed and resources cleaned up")
     
     def test_trained_model(self, model_path: str = None):
@@ -479,7 +686,7 @@ class SeleniumRLTrainer:
         try:
             # Run a test episode
             print("🎮 Running test episode...")
-            success = self._run_episode("TEST")
+            success = self._run_episode(1)
             
             print(f"\n🎯 Test Result: {'SUCCESS' if success else 'FAILED'}")
             
@@ -507,12 +714,25 @@ def main():
     
     target_url = f"file://{html_path}"
     
+    # --num-workers N plays N episodes at a time, one browser each
+    num_workers = 1
+    if "--num-workers" in sys.argv:
+        num_workers = int(sys.argv[sys.argv.index("--num-workers") + 1])
+    
+    # --planning-steps N replays N remembered transitions after each step (Dyna-Q)
+    planning_steps = 0
+    if "--planning-steps" in sys.argv:
+        planning_steps = int(sys.argv[sys.argv.index("--planning-steps") + 1])
+    
     # Create trainer
     trainer = SeleniumRLTrainer(
         target_url=target_url,
         max_episodes=15,  # Start with fewer episodes for demo
         max_steps_per_episode=12,
-        debug=True
+        debug=True,
+        num_workers=num_workers,
+        planning_steps=planning_steps,
+        show_plot="--show-plot" in sys.argv
     )
     
     # Start training
@@ -5,8 +5,42 @@ This will help us understand why it's stuck at 33.3% completion
 """
 
 import os
-import sys
-sys.path.append('src')
+from html.parser import HTMLParser
+
+# Demo form location, worked out once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_HTML_PATH = os.path.join(_HERE, "demo", "test_form.html")
+_TEMPLATE_PATH = os.path.join(_HERE, "templates", "targeted_training.py.tmpl")
+
+class _FormCounter(HTMLParser):
+    """Counts form elements and required attributes in one pass over the HTML"""
+    
+    COUNTED_TAGS = ('input', 'select', 'button')
+    
+    def __init__(self):
+        super().__init__()
+        self.counts = dict.fromkeys(self.COUNTED_TAGS + ('required',), 0)
+        self.has_name = False
+        self.has_email = False
+        self.has_submit = False
+    
+    def handle_starttag(self, tag, attrs):
+        if tag not in self.COUNTED_TAGS:
+            return
+        
+        self.counts[tag] += 1
+        attrs = dict(attrs)
+        if 'required' in attrs:
+            self.counts['required'] += 1
+        
+        field = f"{attrs.get('id') or ''} {attrs.get('name') or ''}".lower()
+        field_type = (attrs.get('type') or '').lower()
+        if 'name' in field:
+            self.has_name = True
+        if field_type == 'email' or 'email' in field:
+            self.has_email = True
+        if field_type == 'submit' or 'submit' in field:
+            self.has_submit = True
 
 def manual_form_check():
     """
@@ -15,44 +49,49 @@ def manual_form_check():
     print("🔍 MANUAL FORM CHECK:")
     print("=" * 30)
     
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    html_path = os.path.join(current_dir, "demo", "test_form.html")
+    html_path = _HTML_PATH
     
     if os.path.exists(html_path):
         print(f"✅ Found form file: {html_path}")
         try:
+            # Count form elements manually
+            counter = _FormCounter()
             with open(html_path, 'r') as f:
-                content = f.read()
+                counter.feed(f.read())
+            counter.close()
             
-            # Count form elements manually
-            input_count = content.count('<input')
-            select_count = content.count('<select')
-            button_count = content.count('<button')
+            input_count = counter.counts['input']
+            select_count = counter.counts['select']
+            button_count = counter.counts['button']
             
-            print(f"📊 Quick element count:")
-            print(f"   Input elements: {input_count}")
-            print(f"   Select elements: {select_count}")
-            print(f"   Button elements: {button_count}")
-            print(f"   Total: {input_count + select_count + button_count}")
+            print("\n".join([
+                "📊 Quick element count:",
+                f"   Input elements: {input_count}",
+                f"   Select elements: {select_count}",
+                f"   Button elements: {button_count}",
+                f"   Total: {input_count + select_count + button_count}"
+            ]))
             
             # Look for required fields
-            required_count = content.count('required')
+            required_count = counter.counts['required']
             print(f"   'required' attributes: {required_count}")
             
-            # Look for specific patterns
-            if 'name' in content:
+            # Look for specific fields
+            if counter.has_name:
                 print("   ✅ Name field detected")
-            if 'email' in content:
+            if counter.has_email:
                 print("   ✅ Email field detected")
-            if 'submit' in content.lower():
+            if counter.has_submit:
                 print("   ✅ Submit button detected")
             
             # Calculate 33.3% completion meaning
             total_elements = input_count + select_count + button_count
             completion_33 = total_elements * 0.333
-            print(f"\n🔍 33.3% COMPLETION ANALYSIS:")
-            print(f"   33.3% of {total_elements} elements = {completion_33:.1f} elements")
-            print(f"   Your AI is completing ~{int(completion_33)} out of {total_elements} elements")
+            print("\n".join([
+                "\n🔍 33.3% COMPLETION ANALYSIS:",
+                f"   33.3% of {total_elements} elements = {completion_33:.1f} elements",
+                f"   Your AI is completing ~{int(completion_33)} out of {total_elements} elements"
+            ]))
             
             return total_elements, required_count
         except Exception as e:
@@ -69,57 +108,17 @@ def create_targeted_trainer():
     """
     print("\n🎯 CREATING TARGETED TRAINING SCRIPT...")
     
-    targeted_script = '''#!/usr/bin/env python3
-"""
-TARGETED TRAINING - Focused on Breaking Through 33.3% Barrier
-"""
-
-import os
-import sys
-sys.path.append('src')
-
-from complete_trainer import SeleniumRLTrainer
-
-def targeted_training():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    html_path = os.path.join(current_dir, "demo", "test_form.html")
-    target_url = f"file://{html_path}"
-    
-    print("🎯 TARGETED TRAINING - BREAKING THE 33.3% BARRIER")
-    print("=" * 60)
-    
-    # Even more focused training
-    trainer = SeleniumRLTrainer(
-        target_url=target_url,
-        max_episodes=35,              # More episodes
-        max_steps_per_episode=50,     # Significantly more steps
-        save_model_path="trained_model.pkl",
-        debug=True
-    )
-    
-    # Load existing knowledge
-    if trainer.agent.load_model("trained_model.pkl"):
-        print("✅ Loading your AI's accumulated knowledge...")
-        print(f"   📚 Episodes completed so far: {trainer.agent.total_episodes}")
-        print(f"   🧠 States learned: {len(trainer.agent.q_table)}")
-        print("   🚀 Continuing with improved parameters!")
-    
-    print("\\n🎯 TARGETED IMPROVEMENTS:")
-    print("   ✅ More steps per episode (50 vs 25)")
-    print("   ✅ More episodes for pattern learning (35)")
-    print("   ✅ Existing Q-table knowledge preserved")
-    print("   ✅ Focus on breaking the 33.3% barrier")
-    
-    trainer.start_training()
-
-if __name__ == "__main__":
-    targeted_training()
-'''
-    
-    with open("targeted_training.py", "w") as f:
-        f.write(targeted_script)
-    
-    print("✅ Created: targeted_training.py")
+    if os.path.exists("targeted_training.py"):
+        print("✅ Using existing: targeted_training.py")
+    else:
+        with open(_TEMPLATE_PATH, 'rb') as f:
+            template = f.read()
+        
+        # Created executable straight away (it has a #! line), no chmod afterwards
+        fd = os.open("targeted_training.py", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(template)
+        print("✅ Created: targeted_training.py")
     print("🚀 Run with: python3 targeted_training.py")
 
 def suggest_improvements(total_elements, required_count):
@@ -131,37 +130,49 @@ def suggest_improvements(total_elements, required_count):
     
     completion_33 = int(total_elements * 0.333)
     
-    print(f"🎯 ANALYSIS RESULTS:")
-    print(f"   Total form elements: {total_elements}")
-    print(f"   Required fields: {required_count}")
-    print(f"   33.3% completion = {completion_33} elements")
-    print(f"   Missing: {total_elements - completion_33} elements")
-    
-    print(f"\n🔧 SPECIFIC FIXES:")
-    print("1. 🎯 Increase Steps Per Episode")
-    print("   - Current: 25 steps")
-    print("   - Recommended: 50+ steps")
-    print("   - Reason: AI needs more actions to complete all fields")
-    
-    print("2. 📝 Focus on Sequential Completion")
-    print("   - AI is completing exactly 1/3 of fields")
-    print("   - Needs to learn the full sequence")
-    print("   - More episodes will help find the pattern")
-    
-    print("3. 🚀 Breakthrough Strategy")
-    print("   - 54.97 reward shows AI is learning")
-    print("   - 96.6% action success is excellent")
-    print("   - Just needs more time to find complete solution")
-    
-    print("4. 🔄 Patient Training")
-    print("   - Your AI is SO CLOSE to success!")
-    print("   - The consistent 33.3% shows it found a pattern")
-    print("   - More episodes + steps should break through")
+    print("\n".join([
+        "🎯 ANALYSIS RESULTS:",
+        f"   Total form elements: {total_elements}",
+        f"   Required fields: {required_count}",
+        f"   33.3% completion = {completion_33} elements",
+        f"   Missing: {total_elements - completion_33} elements"
+    ]))
+    
+    print("\n".join([
+        "\n🔧 SPECIFIC FIXES:",
+        "1. 🎯 Increase Steps Per Episode",
+        "   - Current: 25 steps",
+        "   - Recommended: 50+ steps",
+        "   - Reason: AI needs more actions to complete all fields"
+    ]))
+    
+    print("\n".join([
+        "2. 📝 Focus on Sequential Completion",
+        "   - AI is completing exactly 1/3 of fields",
+        "   - Needs to learn the full sequence",
+        "   - More episodes will help find the pattern"
+    ]))
+    
+    print("\n".join([
+        "3. 🚀 Breakthrough Strategy",
+        "   - 54.97 reward shows AI is learning",
+        "   - 96.6% action success is excellent",
+        "   - Just needs more time to find complete solution"
+    ]))
+    
+    print("\n".join([
+        "4. 🔄 Patient Training",
+        "   - Your AI is SO CLOSE to success!",
+        "   - The consistent 33.3% shows it found a pattern",
+        "   - More episodes + steps should break through"
+    ]))
 
 def main():
-    print("🤖 SELENIUM RL FORM ANALYZER")
-    print("=" * 40)
-    print("Let's figure out why your AI is stuck at 33.3%!")
+    print("\n".join([
+        "🤖 SELENIUM RL FORM ANALYZER",
+        "=" * 40,
+        "Let's figure out why your AI is stuck at 33.3%!"
+    ]))
     
     # Manual form analysis
     total_elements, required_count = manual_form_check()
@@ -173,23 +184,29 @@ def main():
         # Create targeted training script
         create_targeted_trainer()
         
-        print("\n🎉 ANALYSIS COMPLETE!")
-        print("=" * 30)
-        print("✅ Form structure analyzed")
-        print("✅ Requirements identified") 
-        print("✅ Targeted training script created")
-        print("✅ Ready for breakthrough training!")
+        print("\n".join([
+            "\n🎉 ANALYSIS COMPLETE!",
+            "=" * 30,
+            "✅ Form structure analyzed",
+            "✅ Requirements identified",
+            "✅ Targeted training script created",
+            "✅ Ready for breakthrough training!"
+        ]))
         
-        print("\n🚀 NEXT STEPS:")
-        print("1. Run: python3 targeted_training.py")
-        print("2. Monitor for >33.3% completion")
-        print("3. Look for first successful episode!")
-        print("4. Your AI remembers all previous learning!")
+        print("\n".join([
+            "\n🚀 NEXT STEPS:",
+            "1. Run: python3 targeted_training.py",
+            "2. Monitor for >33.3% completion",
+            "3. Look for first successful episode!",
+            "4. Your AI remembers all previous learning!"
+        ]))
         
-        print("\n📊 PREDICTION:")
-        print("With 50 steps per episode, your AI should")
-        print("break through the 33.3% barrier and achieve")
-        print("its first successful form completion! 🎯")
+        print("\n".join([
+            "\n📊 PREDICTION:",
+            "With 50 steps per episode, your AI should",
+            "break through the 33.3% barrier and achieve",
+            "its first successful form completion! 🎯"
+        ]))
         
     else:
         print("\n❌ Could not analyze form file")
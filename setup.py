@@ -6,7 +6,68 @@ Run this script to set up the project and see a quick demonstration
 
 import os
 import sys
-import subprocess
+import importlib.util
+
+# Keep this script free of numpy/pandas/matplotlib imports: it only creates
+# folders and checks files. The training scripts import matplotlib inside
+# their plotting functions for the same reason.
+
+# Directory name -> set of entry names, read once per directory
+_dir_entries = {}
+
+def _dir_index(path):
+    """Return the names in a directory, reading it only the first time"""
+    entries = _dir_entries.get(path)
+    if entries is None:
+        try:
+            with os.scandir(path) as it:
+                entries = {entry.name for entry in it}
+        except FileNotFoundError:
+            entries = set()
+        _dir_entries[path] = entries
+    return entries
+
+def _file_present(path):
+    """Check a relative path against its parent directory's cached listing"""
+    parent, name = os.path.split(path)
+    return name in _dir_index(parent or '.')
+
+# Static text blocks, each written out in one go
+SETUP_HEADER = f"""🚀 SELENIUM RL PROJECT SETUP
+{'=' * 40}
+"""
+
+PROJECT_INFO = f"""
+🤖 SELENIUM RL EDUCATIONAL PROJECT
+{'=' * 50}
+🎯 Goal: Train AI to automatically fill web forms
+🧠 Method: Q-Learning reinforcement learning
+🏆 Achievement: Reached Episode 100 with 129.73 reward!
+
+📊 Project Stats:
+   🎮 Episodes Completed: 100+
+   🏅 Best Reward: 129.73
+   ⚡ Action Success Rate: 99.9%
+   🧠 States Learned: 4
+   📈 Total Learning Steps: 3,530+
+"""
+
+SETUP_COMPLETE = f"""
+🎉 SETUP COMPLETE!
+{'=' * 25}
+🚀 Ready to start training your AI!
+
+📚 Quick Start:
+   1. Run: python3 complete_trainer.py
+   2. Watch your AI learn!
+   3. Check training_progress_*.png for results
+
+💡 Tips:
+   - Start with complete_trainer.py for basic training
+   - Use form_analyzer_fixed.py to understand the form
+   - Try breakthrough_training.py for advanced sessions
+   - All training progress is automatically saved
+"""
 
 def check_dependencies():
     """Check if required dependencies are installed"""
@@ -15,11 +76,11 @@ def check_dependencies():
     required_packages = ['selenium', 'numpy', 'matplotlib', 'pandas']
     missing_packages = []
     
+    # find_spec only locates the package, it doesn't run its (slow) import code
     for package in required_packages:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"   ✅ {package}")
-        except ImportError:
+        else:
             print(f"   ❌ {package} - Missing!")
             missing_packages.append(package)
     
@@ -36,10 +97,13 @@ def setup_project_structure():
     print("\n📁 Setting up project structure...")
     
     directories = ['models', 'logs', 'results']
+    present = _dir_index('.')
     
     for directory in directories:
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+        existed = directory in present
+        os.makedirs(directory, exist_ok=True)
+        if not existed:
+            present.add(directory)  # keep the cached listing in step
             print(f"   ✅ Created {directory}/")
         else:
             print(f"   📁 {directory}/ already exists")
@@ -49,7 +113,7 @@ def check_demo_form():
     print("\n🌐 Checking demo form...")
     
     demo_path = "demo/test_form.html"
-    if os.path.exists(demo_path):
+    if _file_present(demo_path):
         print("   ✅ Demo form found!")
         return True
     else:
@@ -68,30 +132,20 @@ def show_training_options():
         ("form_analyzer_fixed.py", "Analyze form structure and requirements")
     ]
     
-    for script, description in scripts:
-        if os.path.exists(script):
-            print(f"✅ {script:<25} - {description}")
-        else:
-            print(f"❌ {script:<25} - Missing!")
+    present = _dir_index('.')
+    print("\n".join(
+        f"✅ {script:<25} - {description}" if script in present
+        else f"❌ {script:<25} - Missing!"
+        for script, description in scripts
+    ))
 
 def display_project_info():
     """Display project information and achievements"""
-    print("\n🤖 SELENIUM RL EDUCATIONAL PROJECT")
-    print("=" * 50)
-    print("🎯 Goal: Train AI to automatically fill web forms")
-    print("🧠 Method: Q-Learning reinforcement learning")
-    print("🏆 Achievement: Reached Episode 100 with 129.73 reward!")
-    print("\n📊 Project Stats:")
-    print("   🎮 Episodes Completed: 100+")
-    print("   🏅 Best Reward: 129.73")
-    print("   ⚡ Action Success Rate: 99.9%")
-    print("   🧠 States Learned: 4")
-    print("   📈 Total Learning Steps: 3,530+")
+    sys.stdout.write(PROJECT_INFO)
 
 def main():
     """Main setup function"""
-    print("🚀 SELENIUM RL PROJECT SETUP")
-    print("=" * 40)
+    sys.stdout.write(SETUP_HEADER)
     
     # Check dependencies
     if not check_dependencies():
@@ -111,19 +165,7 @@ def main():
     # Display project info
     display_project_info()
     
-    print(f"\n🎉 SETUP COMPLETE!")
-    print("=" * 25)
-    print("🚀 Ready to start training your AI!")
-    print("\n📚 Quick Start:")
-    print("   1. Run: python3 complete_trainer.py")
-    print("   2. Watch your AI learn!")
-    print("   3. Check training_progress_*.png for results")
-    
-    print(f"\n💡 Tips:")
-    print("   - Start with complete_trainer.py for basic training")
-    print("   - Use form_analyzer_fixed.py to understand the form")
-    print("   - Try breakthrough_training.py for advanced sessions")
-    print("   - All training progress is automatically saved")
+    sys.stdout.write(SETUP_COMPLETE)
 
 if __name__ == "__main__":
     main()
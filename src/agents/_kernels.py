@@ -0,0 +1,101 @@
+"""
+Q-Learning Kernels - The Agent's Number Crunching
+===============================================
+
+The small numeric functions that run on every training step live here
+so they can be compiled to machine code with Numba when it is installed.
+Without Numba they run as ordinary Python/NumPy code with the same results.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    def njit(*args, **kwargs):
+        """Fallback decorator: leave the function as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+# Row (and its known-actions mask) used for states that have no Q-values yet
+NO_VALUES = np.zeros(0, dtype=np.float32)
+NO_ACTIONS = np.zeros(0, dtype=np.bool_)
+
+@njit(cache=True)
+def known_max(q_row, known):
+    """Highest Q-value among the known actions of a state (0.0 if it has none)"""
+    best_q = 0.0
+    found = False
+
+    for i in range(q_row.shape[0]):
+        if known[i] and (not found or q_row[i] > best_q):
+            best_q = q_row[i]
+            found = True
+
+    return best_q
+
+@njit(cache=True)
+def bellman_update(q_row, action_id, reward, next_row, next_known, done,
+                   learning_rate, discount_factor):
+    """
+    Apply one Q-Learning update in place and return the new Q-value
+
+    Q(s,a) = Q(s,a) + α * [reward + γ * max(Q(s',a')) - Q(s,a)]
+
+    The max only covers the next state's known actions (next_known).
+    """
+    current_q = q_row[action_id]
+
+    max_future_q = 0.0
+    if not done and next_row.shape[0] > 0:
+        max_future_q = known_max(next_row, next_known)
+
+    target_q = reward + discount_factor * max_future_q
+    new_q = current_q + learning_rate * (target_q - current_q)
+    q_row[action_id] = new_q
+    return new_q
+
+@njit(cache=True)
+def best_action_index(q_row, action_ids):
+    """Position in action_ids of the action with the highest Q-value (first one on ties)"""
+    best_index = 0
+    best_q = -np.inf
+
+    for i in range(action_ids.shape[0]):
+        action_id = action_ids[i]
+        q_value = q_row[action_id] if action_id < q_row.shape[0] else 0.0
+        if q_value > best_q:
+            best_q = q_value
+            best_index = i
+
+    return best_index
+
+@njit(cache=True)
+def bellman_update_batch(q_values, known_actions, state_ids, action_ids, rewards, next_state_ids,
+                         dones, n_actions, learning_rate, discount_factor):
+    """
+    bellman_update for a batch of transitions, applied in order
+
+    Rows and columns are Q-table ids; a next_state_id of -1 means there is
+    no next state. Only the first n_actions columns hold real actions, and
+    the max only covers those marked in known_actions.
+    The loop is deliberately sequential: a batch can update the same
+    (state, action) twice, and each update must see the one before it.
+    """
+    for k in range(state_ids.shape[0]):
+        state_id = state_ids[k]
+        action_id = action_ids[k]
+
+        max_future_q = 0.0
+        next_state_id = next_state_ids[k]
+        if not dones[k] and next_state_id >= 0 and n_actions > 0:
+            max_future_q = known_max(q_values[next_state_id, :n_actions],
+                                     known_actions[next_state_id, :n_actions])
+
+        current_q = q_values[state_id, action_id]
+        target_q = rewards[k] + discount_factor * max_future_q
+        q_values[state_id, action_id] = current_q + learning_rate * (target_q - current_q)
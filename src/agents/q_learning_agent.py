@@ -11,25 +11,23 @@ This is the core intelligence that learns from experience:
 Think of it as the AI's memory and decision-making center.
 """
 
+import os
 import numpy as np
-import pandas as pd
 import pickle
 import random
 import json
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
-import matplotlib.pyplot as plt
+from collections import Counter, defaultdict
+from functools import lru_cache
 
-@dataclass
-class Experience:
-    """A single learning experience: what happened when the AI took an action"""
-    state: str
-    action: str
-    reward: float
-    next_state: str
-    done: bool
-    timestamp: float
+try:
+    from ._kernels import NO_ACTIONS, NO_VALUES, bellman_update, bellman_update_batch, best_action_index, known_max
+except ImportError:  # Running this file directly as a script
+    # Import through the package anyway: Numba's on-disk cache remembers the
+    # module name, so loading the kernels under a second name would break it
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+    from src.agents._kernels import NO_ACTIONS, NO_VALUES, bellman_update, bellman_update_batch, best_action_index, known_max
 
 class QLearningAgent:
     """
@@ -40,12 +38,29 @@ class QLearningAgent:
     based on the rewards it receives.
     """
     
+    # How likely each kind of action is to be picked while exploring.
+    # Filling in an empty required field is usually progress; random
+    # clicks and clearing fields rarely are.
+    EXPLORATION_PRIORS = {
+        'fill_required': 4.0,
+        'type': 1.0,
+        'select': 1.0,
+        'check': 1.0,
+        'uncheck': 0.5,
+        'click': 0.5,
+        'clear': 0.5
+    }
+    
     def __init__(self, 
                  learning_rate: float = 0.1,
                  discount_factor: float = 0.95,
                  epsilon: float = 0.3,
                  epsilon_decay: float = 0.995,
                  epsilon_min: float = 0.01,
+                 submit_prior: float = -50.0,
+                 planning_steps: int = 0,
+                 memory_size: int = 10000,
+                 memory_dir: Optional[str] = None,
                  debug: bool = True):
         """
         Initialize the AI's brain
@@ -56,19 +71,37 @@ class QLearningAgent:
             epsilon: Exploration rate (0.3 = explores 30% of the time)
             epsilon_decay: How quickly exploration decreases
             epsilon_min: Minimum exploration rate
+            submit_prior: Starting Q-value for submitting an incomplete form
+                          (it always fails, so there's no need to learn that by trial)
+            planning_steps: Extra Q-updates replayed from remembered transitions
+                            after every real step (Dyna-Q, 0 = off)
+            memory_size: How many past experiences to remember
+            memory_dir: Keep the experience memory in files in this folder
+                        instead of RAM (for very large memory_size)
             debug: Print learning information
         """
         # Core Q-Learning parameters
         self.learning_rate = learning_rate
         self.discount_factor = discount_factor
         self.epsilon = epsilon
+        self.initial_epsilon = epsilon
         self.epsilon_decay = epsilon_decay
         self.epsilon_min = epsilon_min
+        self.submit_prior = submit_prior
+        self.planning_steps = planning_steps
         self.debug = debug
         
         # Q-table: stores the "value" of each action in each state
-        # Format: Q[state][action] = expected_reward
-        self.q_table = defaultdict(lambda: defaultdict(float))
+        # Format: q_values[state_index[state], action_index[action]] = expected_reward
+        # One dense array that doubles in size when full; unseen entries are 0.0
+        self.q_values = np.zeros((16, 32), dtype=np.float32)
+        # Which actions each state has (offered there or learned); max(Q(s',a'))
+        # only looks at these, so columns of other actions don't count as 0.0
+        self.known_actions = np.zeros((16, 32), dtype=np.bool_)
+        self.state_index = {}   # state string -> row
+        self.states = []        # row -> state string
+        self.action_index = {}  # action string -> column
+        self.actions = []       # column -> action string
         
         # Learning statistics
         self.total_episodes = 0
@@ -78,12 +111,28 @@ class QLearningAgent:
         self.success_episodes = []
         
         # Experience memory for advanced learning
-        self.memory = deque(maxlen=10000)
+        # A ring buffer kept as parallel arrays: one entry per learn() call,
+        # with states and actions stored by their Q-table ids
+        self.memory_dir = memory_dir
+        self._mem_states = self._memory_array('states', np.int32, memory_size)
+        self._mem_actions = self._memory_array('actions', np.int32, memory_size)
+        self._mem_rewards = self._memory_array('rewards', np.float32, memory_size)
+        self._mem_next_states = self._memory_array('next_states', np.int32, memory_size)  # -1 = no next state
+        self._mem_dones = self._memory_array('dones', np.bool_, memory_size)
         self.experience_count = 0
         
         # Action tracking
         self.action_counts = defaultdict(int)
         self.state_visits = defaultdict(int)
+        self._exploration_weights = {}  # action -> latest prior weight, set by get_possible_actions
+        self._submit_actions = set()     # actions that submit the form
+        self._incomplete_states = set()  # states where the form is not finished yet
+        self._signature_cache = {}       # tuple of counts -> state signature string
+        self._element_actions_cache = {} # element key -> {action: exploration weight}
+        
+        # Dyna-Q model: last seen outcome of each (state, action)
+        self.model = {}        # (state, action) -> (next_state, reward, done)
+        self._model_keys = []  # same keys as a list, for cheap random picks
         
         if self.debug:
             print("🧠 Q-Learning Agent initialized!")
@@ -91,98 +140,309 @@ class QLearningAgent:
             print(f"   Exploration rate: {epsilon}")
             print(f"   Discount factor: {discount_factor}")
     
+    def _memory_array(self, name: str, dtype, size: int) -> np.ndarray:
+        """One field of the experience memory, in RAM or memory-mapped from memory_dir"""
+        if self.memory_dir is None:
+            return np.zeros(size, dtype=dtype)
+        
+        os.makedirs(self.memory_dir, exist_ok=True)
+        path = os.path.join(self.memory_dir, f"memory_{name}.dat")
+        return np.memmap(path, dtype=dtype, mode='w+', shape=(size,))
+    
+    def close(self):
+        """Write a memory-mapped experience memory out to disk"""
+        if self.memory_dir is None:
+            return
+        
+        for array in (self._mem_states, self._mem_actions, self._mem_rewards,
+                      self._mem_next_states, self._mem_dones):
+            array.flush()
+    
     def get_state_signature(self, elements: List, form_state: Dict) -> str:
         """
         Convert webpage state into a string signature
         This is how the AI "remembers" different webpage situations
+        
+        The string is only built the first time a situation is seen;
+        after that it comes from a cache keyed by a small tuple of ints.
         """
         # Count different types of elements
-        element_counts = {}
-        filled_fields = 0
+        element_counts = Counter(elem.element_type for elem in elements)
+        required = [elem for elem in elements if elem.is_required]
+        required_fields = len(required)
+        filled_fields = sum(1 for elem in required if elem.value and elem.value.strip())
+        
+        return self._state_signature(element_counts, required_fields, filled_fields, form_state)
+    
+    def analyze(self, elements: List, form_state: Dict) -> Tuple[str, List[str]]:
+        """
+        get_state_signature and get_possible_actions in one pass over the elements
+        
+        Returns:
+            (state signature, possible actions)
+        """
+        element_counts = Counter()
         required_fields = 0
+        filled_fields = 0
+        actions = []
         
         for elem in elements:
-            elem_type = elem.element_type.value
-            element_counts[elem_type] = element_counts.get(elem_type, 0) + 1
-            
+            element_counts[elem.element_type] += 1
+            has_value = bool(elem.value and elem.value.strip())
             if elem.is_required:
                 required_fields += 1
-                if elem.value and elem.value.strip():
-                    filled_fields += 1
+                filled_fields += has_value
+            self._add_element_actions(elem, has_value, actions)
         
+        state_signature = self._state_signature(element_counts, required_fields,
+                                                filled_fields, form_state)
+        return state_signature, actions
+    
+    def _state_signature(self, element_counts: Counter, required_fields: int,
+                         filled_fields: int, form_state: Dict) -> str:
+        """Signature string for the counted page contents (cached per distinct situation)"""
         # Include form completion progress
-        progress = form_state.get('progress', 0)
+        progress_bucket = int(form_state.get('progress', 0) // 10) * 10  # 10% buckets
         is_complete = form_state.get('completed', False)
         
-        # Create a state signature
-        state_parts = [
-            f"progress_{int(progress//10)*10}",  # Progress in 10% buckets
-            f"filled_{filled_fields}",
-            f"required_{required_fields}",
-            f"complete_{is_complete}"
-        ]
-        
-        # Add element type counts
-        for elem_type, count in sorted(element_counts.items()):
-            state_parts.append(f"{elem_type}_{count}")
+        key = (progress_bucket, filled_fields, required_fields, is_complete,
+               tuple(element_counts.items()))
+        state_signature = self._signature_cache.get(key)
+        
+        if state_signature is None:
+            # Create a state signature
+            state_parts = [
+                f"progress_{progress_bucket}",
+                f"filled_{filled_fields}",
+                f"required_{required_fields}",
+                f"complete_{is_complete}"
+            ]
+            
+            # Add element type counts
+            for elem_type, count in sorted((t.value, c) for t, c in element_counts.items()):
+                state_parts.append(f"{elem_type}_{count}")
+            
+            state_signature = "|".join(state_parts)
+            self._signature_cache[key] = state_signature
+            if progress_bucket < 100:
+                self._incomplete_states.add(state_signature)
         
-        state_signature = "|".join(state_parts)
         self.state_visits[state_signature] += 1
-        
         return state_signature
     
     def get_possible_actions(self, elements: List) -> List[str]:
         """
         Generate all possible actions the AI can take
         Each action is a string like "click_submitBtn" or "type_name_John"
+        
+        Also records each action's exploration weight (see EXPLORATION_PRIORS).
+        An element's actions are worked out once and reused while it looks the same.
         """
         actions = []
-        
         for elem in elements:
-            if not elem.is_enabled:
-                continue
+            self._add_element_actions(elem, bool(elem.value and elem.value.strip()), actions)
+        return actions
+    
+    def _add_element_actions(self, elem, has_value: bool, actions: List[str]):
+        """Append an enabled element's actions to actions and record their exploration weights"""
+        if not elem.is_enabled:
+            return
+        
+        needs_filling = elem.is_required and not has_value
+        key = (elem.id, elem.element_type, tuple(elem.possible_actions),
+               elem.is_required, needs_filling, elem.is_checked)
+        
+        element_actions = self._element_actions_cache.get(key)
+        if element_actions is None:
+            element_actions = self._build_element_actions(elem, needs_filling)
+            self._element_actions_cache[key] = element_actions
+        
+        actions.extend(element_actions)
+        self._exploration_weights.update(element_actions)
+    
+    def _build_element_actions(self, elem, needs_filling: bool) -> Dict[str, float]:
+        """Work out one element's actions and their exploration weights"""
+        element_actions = {}
+        priors = self.EXPLORATION_PRIORS
+        elem_id = elem.id
+        
+        # Generate actions based on element type and capabilities
+        for action_type in elem.possible_actions:
+            if action_type.value == "click":
+                action = f"click_{elem_id}"
+                element_actions[action] = priors['click']
+                if elem.element_type.value == "submit" or "submit" in elem_id.lower():
+                    self._submit_actions.add(action)
+                    self._get_action_id(action)  # New rows then include its prior
                 
-            elem_id = elem.id
-            
-            # Generate actions based on element type and capabilities
-            for action_type in elem.possible_actions:
-                if action_type.value == "click":
-                    actions.append(f"click_{elem_id}")
-                    
-                elif action_type.value == "type_text":
-                    # Generate different text options
-                    sample_texts = self._get_sample_texts(elem)
-                    for text in sample_texts:
-                        actions.append(f"type_{elem_id}_{text}")
-                        
-                elif action_type.value == "select_option":
-                    # For dropdowns, we'll add generic select action
-                    actions.append(f"select_{elem_id}")
+            elif action_type.value == "type_text":
+                # Generate different text options
+                sample_texts = self._get_sample_texts(elem.element_type.value, elem_id)
+                for text in sample_texts:
+                    action = f"type_{elem_id}_{text}"
+                    element_actions[action] = priors['fill_required' if needs_filling else 'type']
                     
-                elif action_type.value == "check":
-                    actions.append(f"check_{elem_id}")
-                    
-                elif action_type.value == "uncheck":
-                    actions.append(f"uncheck_{elem_id}")
-                    
-                elif action_type.value == "clear":
-                    actions.append(f"clear_{elem_id}")
+            elif action_type.value == "select_option":
+                # For dropdowns, we'll add generic select action
+                element_actions[f"select_{elem_id}"] = priors['fill_required' if needs_filling else 'select']
+                
+            elif action_type.value == "check":
+                needs_checking = elem.is_required and not elem.is_checked
+                element_actions[f"check_{elem_id}"] = priors['fill_required' if needs_checking else 'check']
+                
+            elif action_type.value == "uncheck":
+                element_actions[f"uncheck_{elem_id}"] = priors['uncheck']
+                
+            elif action_type.value == "clear":
+                element_actions[f"clear_{elem_id}"] = priors['clear']
         
-        return actions
+        return element_actions
     
-    def _get_sample_texts(self, elem) -> List[str]:
-        """Generate appropriate sample texts for different input types"""
-        elem_type = elem.element_type.value
-        elem_id = elem.id.lower()
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_sample_texts(elem_type: str, elem_id: str) -> Tuple[str, ...]:
+        """Generate appropriate sample texts for different input types (cached per element)"""
+        elem_id = elem_id.lower()
         
         if elem_type == "email_input":
-            return ["test@example.com", "user@demo.com"]
+            return ("test@example.com", "user@demo.com")
         elif "name" in elem_id:
-            return ["John_Doe", "Jane_Smith"]
+            return ("John_Doe", "Jane_Smith")
         elif elem_type == "textarea":
-            return ["AI_learning_demo", "Test_description"]
+            return ("AI_learning_demo", "Test_description")
         else:
-            return ["sample_text", "test_input"]
+            return ("sample_text", "test_input")
+    
+    @property
+    def num_states(self) -> int:
+        """How many states have Q-values"""
+        return len(self.states)
+    
+    @property
+    def q_table(self) -> Dict[str, Dict[str, float]]:
+        """Snapshot of the Q-table as {state: {action: q_value}} (known actions only)"""
+        n_actions = len(self.actions)
+        return {
+            state: {
+                action: q_value
+                for action, q_value, known in zip(self.actions, self.q_values[i, :n_actions].tolist(),
+                                                  self.known_actions[i, :n_actions].tolist())
+                if known
+            }
+            for i, state in enumerate(self.states)
+        }
+    
+    def _grow_q_values(self, n_rows: int, n_cols: int):
+        """Make sure q_values has room for n_rows states and n_cols actions"""
+        rows, cols = self.q_values.shape
+        if n_rows <= rows and n_cols <= cols:
+            return
+        
+        while rows < n_rows:
+            rows *= 2
+        while cols < n_cols:
+            cols *= 2
+        
+        old_rows, old_cols = self.q_values.shape
+        grown = np.zeros((rows, cols), dtype=self.q_values.dtype)
+        grown[:old_rows, :old_cols] = self.q_values
+        self.q_values = grown
+        grown_known = np.zeros((rows, cols), dtype=np.bool_)
+        grown_known[:old_rows, :old_cols] = self.known_actions
+        self.known_actions = grown_known
+    
+    def _get_action_id(self, action: str) -> int:
+        """Give every action a stable column in the Q-table"""
+        action_id = self.action_index.get(action)
+        if action_id is None:
+            action_id = len(self.actions)
+            self._grow_q_values(len(self.states), action_id + 1)
+            self.action_index[action] = action_id
+            self.actions.append(action)
+            
+            # Submitting an incomplete form is known to fail
+            if action in self._submit_actions:
+                for state in self._incomplete_states:
+                    state_id = self.state_index.get(state)
+                    if state_id is not None:
+                        self.q_values[state_id, action_id] = self.submit_prior
+        return action_id
+    
+    def _get_state_id(self, state: str) -> int:
+        """Give every state a stable row in the Q-table"""
+        state_id = self.state_index.get(state)
+        
+        if state_id is None:
+            state_id = len(self.states)
+            self._grow_q_values(state_id + 1, len(self.actions))
+            self.state_index[state] = state_id
+            self.states.append(state)
+            self._apply_priors(state, self.q_values[state_id])
+        
+        return state_id
+    
+    def _get_state_row(self, state: str) -> np.ndarray:
+        """Get the Q-value row of a state (a view into q_values), creating it if needed"""
+        return self.q_values[self._get_state_id(state), :len(self.actions)]
+    
+    def _peek_state(self, state: Optional[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the Q-value row of a state and its known-actions mask without creating them"""
+        state_id = self.state_index.get(state)
+        if state_id is None:
+            return NO_VALUES, NO_ACTIONS
+        n_actions = len(self.actions)
+        return self.q_values[state_id, :n_actions], self.known_actions[state_id, :n_actions]
+    
+    def _note_actions(self, state: str, possible_actions: List[str]) -> Tuple[int, np.ndarray]:
+        """Mark possible_actions as known in state; returns (state id, action ids)"""
+        action_ids = np.fromiter(map(self._get_action_id, possible_actions),
+                                 dtype=np.intp, count=len(possible_actions))
+        # (state id after action ids: adding an action can reallocate q_values)
+        state_id = self._get_state_id(state)
+        self.known_actions[state_id, action_ids] = True
+        return state_id, action_ids
+    
+    def _apply_priors(self, state: str, row: np.ndarray):
+        """Give a new state's Q-values their starting values"""
+        if state not in self._incomplete_states:
+            return
+        
+        # Submitting an incomplete form is known to fail
+        for action in self._submit_actions:
+            action_id = self.action_index.get(action)
+            if action_id is not None:
+                row[action_id] = self.submit_prior
+    
+    def snapshot(self) -> 'QLearningAgent':
+        """
+        A frozen copy of what the agent has learned, for evaluation
+        
+        The copy always exploits (epsilon 0) and shares nothing with this
+        agent, so it can play episodes in another thread while training
+        goes on.
+        """
+        agent = QLearningAgent(learning_rate=self.learning_rate,
+                               discount_factor=self.discount_factor,
+                               epsilon=0.0, epsilon_min=0.0,
+                               submit_prior=self.submit_prior,
+                               memory_size=1, debug=False)
+        agent.q_values = self.q_values.copy()
+        agent.known_actions = self.known_actions.copy()
+        agent.state_index = dict(self.state_index)
+        agent.states = list(self.states)
+        agent.action_index = dict(self.action_index)
+        agent.actions = list(self.actions)
+        agent._submit_actions = set(self._submit_actions)
+        agent._incomplete_states = set(self._incomplete_states)
+        return agent
+    
+    def get_q_value(self, state: str, action: str) -> float:
+        """Look up Q(state, action) without creating any entries"""
+        state_id = self.state_index.get(state)
+        action_id = self.action_index.get(action)
+        if state_id is None or action_id is None:
+            return 0.0
+        return float(self.q_values[state_id, action_id])
     
     def choose_action(self, state: str, possible_actions: List[str]) -> str:
         """
@@ -197,8 +457,10 @@ class QLearningAgent:
         
         # Exploration vs Exploitation decision
         if random.random() < self.epsilon:
-            # EXPLORE: Try something random
-            action = random.choice(possible_actions)
+            # EXPLORE: Try something random, favouring promising kinds of action
+            self._note_actions(state, possible_actions)
+            weights = [self._exploration_weights.get(a, 1.0) for a in possible_actions]
+            action = random.choices(possible_actions, weights=weights)[0]
             if self.debug:
                 print(f"🎲 EXPLORING: Random action '{action[:30]}...'")
         else:
@@ -211,67 +473,200 @@ class QLearningAgent:
         self.action_counts[action] += 1
         return action
     
+    def choose_actions_batch(self, states: List[str],
+                             possible_actions_lists: List[List[str]]) -> List[Optional[str]]:
+        """
+        choose_action for several environments at once
+        
+        The greedy picks for all states come from a single lookup in the
+        Q-table instead of one per state. Returns one action per state
+        (None where there are no possible actions).
+        """
+        chosen = [None] * len(states)
+        
+        # Explore or exploit, decided per state from the same random module
+        # as choose_action (so seeding it reproduces batch choices too)
+        with_actions = [i for i, actions in enumerate(possible_actions_lists) if actions]
+        explore = [i for i in with_actions if random.random() < self.epsilon]
+        exploring = set(explore)
+        greedy = [i for i in with_actions if i not in exploring]
+        
+        # Every offered action becomes known in its state
+        noted = {i: self._note_actions(states[i], possible_actions_lists[i]) for i in with_actions}
+        
+        for i in explore:
+            # EXPLORE: same weighted random pick as choose_action
+            possible_actions = possible_actions_lists[i]
+            weights = [self._exploration_weights.get(a, 1.0) for a in possible_actions]
+            chosen[i] = random.choices(possible_actions, weights=weights)[0]
+        
+        if greedy:
+            # EXPLOIT: one row of action ids per state, padded with -1
+            width = max(len(possible_actions_lists[i]) for i in greedy)
+            action_ids = np.full((len(greedy), width), -1, dtype=np.intp)
+            state_ids = np.empty(len(greedy), dtype=np.intp)
+            for row, i in enumerate(greedy):
+                state_ids[row], ids = noted[i]
+                action_ids[row, :len(ids)] = ids
+            
+            q = self.q_values[state_ids[:, None], np.maximum(action_ids, 0)]
+            q[action_ids < 0] = -np.inf   # padding is never picked
+            best = q.argmax(axis=1)       # first action wins ties, as in choose_action
+            
+            for row, i in enumerate(greedy):
+                chosen[i] = possible_actions_lists[i][best[row]]
+        
+        for action in chosen:
+            if action is not None:
+                self.action_counts[action] += 1
+        
+        if self.debug:
+            print(f"🎯 Chose {len(states)} actions ({len(greedy)} exploiting)")
+        
+        return chosen
+    
     def _get_best_action(self, state: str, possible_actions: List[str]) -> str:
         """Find the action with highest Q-value for this state"""
-        q_values = {}
-        
-        for action in possible_actions:
-            q_values[action] = self.q_table[state][action]
+        state_id, action_ids = self._note_actions(state, possible_actions)
+        state_row = self.q_values[state_id, :len(self.actions)]
         
         # Find action with highest Q-value
-        best_action = max(q_values.keys(), key=lambda a: q_values[a])
+        best_action = possible_actions[best_action_index(state_row, action_ids)]
         
-        if self.debug and q_values[best_action] > 0:
-            print(f"   Q-value: {q_values[best_action]:.3f}")
+        if self.debug:
+            best_q = self.get_q_value(state, best_action)
+            if best_q > 0:
+                print(f"   Q-value: {best_q:.3f}")
         
         return best_action
     
-    def learn(self, state: str, action: str, reward: float, next_state: str, done: bool):
+    def learn(self, state: str, action: str, reward: float, next_state: Optional[str], done: bool):
         """
         Update the AI's knowledge based on what just happened
         This is the core of Q-Learning!
         
         Q(s,a) = Q(s,a) + α * [reward + γ * max(Q(s',a')) - Q(s,a)]
+        
+        next_state may be None when done is True - a finished episode
+        has no future value, so it is never looked at.
         """
         # Get current Q-value
-        current_q = self.q_table[state][action]
-        
-        # Find the best possible future reward
-        if done:
-            # Episode ended, no future rewards
-            max_future_q = 0
-        else:
-            # Look at all possible actions in next state
-            next_state_actions = list(self.q_table[next_state].keys())
-            if next_state_actions:
-                max_future_q = max(self.q_table[next_state][a] for a in next_state_actions)
-            else:
-                max_future_q = 0
-        
-        # Calculate new Q-value using Q-Learning formula
-        target_q = reward + self.discount_factor * max_future_q
-        new_q = current_q + self.learning_rate * (target_q - current_q)
-        
-        # Update Q-table
-        self.q_table[state][action] = new_q
-        
-        # Store experience for analysis
-        experience = Experience(
-            state=state,
-            action=action,
-            reward=reward,
-            next_state=next_state,
-            done=done,
-            timestamp=self.experience_count
-        )
-        self.memory.append(experience)
+        # (ids first: adding a state or action can reallocate q_values)
+        action_id = self._get_action_id(action)
+        next_state_id = -1 if next_state is None else self._get_state_id(next_state)
+        state_id = self._get_state_id(state)
+        self.known_actions[state_id, action_id] = True
+        state_row = self.q_values[state_id, :len(self.actions)]
+        current_q = float(state_row[action_id])
+        
+        # Best value over the actions known in the next state (0 if none are);
+        # an ended episode has no future rewards
+        next_row, next_known = self._peek_state(next_state)
+        
+        # Calculate new Q-value using Q-Learning formula and update Q-table
+        new_q = float(bellman_update(state_row, action_id, reward, next_row, next_known, done,
+                                     self.learning_rate, self.discount_factor))
+        
+        # Remember the outcome and replay a few remembered ones
+        if self.planning_steps > 0:
+            key = (state, action)
+            if key not in self.model:
+                self._model_keys.append(key)
+            self.model[key] = (next_state, reward, done)
+            self._plan()
+        
+        # Store experience for analysis (overwriting the oldest once full)
+        slot = self.experience_count % len(self._mem_rewards)
+        self._mem_states[slot] = state_id
+        self._mem_actions[slot] = action_id
+        self._mem_rewards[slot] = reward
+        self._mem_next_states[slot] = next_state_id
+        self._mem_dones[slot] = done
         self.experience_count += 1
         
         # Debug information
         if self.debug and abs(new_q - current_q) > 0.001:
+            max_future_q = 0.0 if done or not len(next_row) else float(known_max(next_row, next_known))
             print(f"📚 LEARNING: Q({state[:20]}..., {action[:20]}...) = {new_q:.3f} (was {current_q:.3f})")
             print(f"   Reward: {reward:.2f}, Future value: {max_future_q:.3f}")
     
+    def learn_batch(self, transitions: List[Tuple[str, str, float, Optional[str], bool]]):
+        """
+        learn() for a list of (state, action, reward, next_state, done) transitions
+        
+        The Q-updates run in order in one kernel call, so the result is the
+        same as calling learn() for each transition (planning updates, if
+        on, run after the real ones).
+        """
+        count = len(transitions)
+        if count == 0:
+            return
+        
+        # (ids first: adding a state or action can reallocate q_values;
+        # same order as learn() so states get the same rows)
+        state_ids = np.empty(count, dtype=np.intp)
+        action_ids = np.empty(count, dtype=np.intp)
+        next_state_ids = np.empty(count, dtype=np.intp)
+        for k, (state, action, _, next_state, _) in enumerate(transitions):
+            action_ids[k] = self._get_action_id(action)
+            next_state_ids[k] = -1 if next_state is None else self._get_state_id(next_state)
+            state_ids[k] = self._get_state_id(state)
+        rewards = np.fromiter((t[2] for t in transitions), dtype=np.float64, count=count)
+        dones = np.fromiter((t[4] for t in transitions), dtype=np.bool_, count=count)
+        
+        self.known_actions[state_ids, action_ids] = True
+        bellman_update_batch(self.q_values, self.known_actions, state_ids, action_ids, rewards,
+                             next_state_ids, dones, len(self.actions),
+                             self.learning_rate, self.discount_factor)
+        
+        # Remember the outcomes and replay a few remembered ones
+        if self.planning_steps > 0:
+            for state, action, reward, next_state, done in transitions:
+                key = (state, action)
+                if key not in self.model:
+                    self._model_keys.append(key)
+                self.model[key] = (next_state, reward, done)
+            for _ in range(count):
+                self._plan()
+        
+        # Store experiences for analysis (overwriting the oldest once full)
+        slots = (self.experience_count + np.arange(count)) % len(self._mem_rewards)
+        self._mem_states[slots] = state_ids
+        self._mem_actions[slots] = action_ids
+        self._mem_rewards[slots] = rewards
+        self._mem_next_states[slots] = next_state_ids
+        self._mem_dones[slots] = dones
+        self.experience_count += count
+        
+        if self.debug:
+            print(f"📚 LEARNING: {count} experiences, {self.num_states} states known")
+    
+    def sample_experiences(self, batch_size: int) -> Tuple[np.ndarray, ...]:
+        """
+        Pick random remembered experiences
+        
+        Returns (states, actions, rewards, next_states, dones) arrays; states
+        and actions are Q-table ids (see self.states / self.actions).
+        """
+        stored = min(self.experience_count, len(self._mem_rewards))
+        if stored == 0:
+            raise ValueError("No experiences stored yet")
+        
+        picks = np.random.randint(0, stored, batch_size)
+        return (self._mem_states[picks], self._mem_actions[picks], self._mem_rewards[picks],
+                self._mem_next_states[picks], self._mem_dones[picks])
+    
+    def _plan(self):
+        """Dyna-Q planning: extra Q-updates from transitions seen before"""
+        for _ in range(self.planning_steps):
+            state, action = random.choice(self._model_keys)
+            next_state, reward, done = self.model[(state, action)]
+            
+            next_row, next_known = self._peek_state(next_state)
+            bellman_update(self._get_state_row(state), self.action_index[action], reward,
+                           next_row, next_known, done,
+                           self.learning_rate, self.discount_factor)
+    
     def start_episode(self):
         """Start a new learning episode"""
         self.total_episodes += 1
@@ -322,7 +717,7 @@ class QLearningAgent:
         stats = {
             "total_episodes": self.total_episodes,
             "total_steps": self.total_steps,
-            "q_table_size": len(self.q_table),
+            "q_table_size": self.num_states,
             "unique_states": len(self.state_visits),
             "unique_actions": len(self.action_counts),
             "exploration_rate": self.epsilon,
@@ -344,12 +739,17 @@ class QLearningAgent:
         return stats
     
     def save_model(self, filepath: str):
-        """Save the AI's learned knowledge to a file"""
-        model_data = {
-            "q_table": dict(self.q_table),
+        """
+        Save the AI's learned knowledge to a file
+        
+        The file is a compressed NumPy archive: the Q-values as one float32
+        array, the state and action names, and the other settings as JSON.
+        """
+        metadata = {
             "learning_rate": self.learning_rate,
             "discount_factor": self.discount_factor,
             "epsilon": self.epsilon,
+            "initial_epsilon": self.initial_epsilon,
             "total_episodes": self.total_episodes,
             "total_steps": self.total_steps,
             "episode_rewards": self.episode_rewards,
@@ -359,26 +759,68 @@ class QLearningAgent:
             "state_visits": dict(self.state_visits)
         }
         
+        # Written through a file handle so NumPy keeps the name we were given
         with open(filepath, 'wb') as f:
-            pickle.dump(model_data, f)
+            np.savez_compressed(
+                f,
+                q_values=self.q_values[:len(self.states), :len(self.actions)],
+                known_actions=self.known_actions[:len(self.states), :len(self.actions)],
+                states=np.array(self.states, dtype=str),
+                actions=np.array(self.actions, dtype=str),
+                metadata=np.array(json.dumps(metadata, default=float))
+            )
         
         if self.debug:
             print(f"💾 Model saved to {filepath}")
     
     def load_model(self, filepath: str):
-        """Load previously learned knowledge"""
+        """Load previously learned knowledge (NumPy archive or older pickle file)"""
         try:
             with open(filepath, 'rb') as f:
-                model_data = pickle.load(f)
+                is_archive = f.read(2) == b'PK'  # Zip header written by np.savez_compressed
+                f.seek(0)
+                
+                if is_archive:
+                    with np.load(f, allow_pickle=False) as archive:
+                        q_values = archive['q_values']
+                        # (archives without the mask: count every recorded value)
+                        known_actions = (archive['known_actions'] if 'known_actions' in archive.files
+                                         else q_values != 0)
+                        states = archive['states'].tolist()
+                        actions = archive['actions'].tolist()
+                        model_data = json.loads(str(archive['metadata']))
+                else:
+                    model_data = pickle.load(f)
+            
+            # Restore Q-table into the dense array
+            self.q_values = np.zeros((16, 32), dtype=np.float32)
+            self.known_actions = np.zeros((16, 32), dtype=np.bool_)
+            self.state_index = {}
+            self.states = []
+            self.action_index = {}
+            self.actions = []
             
-            # Restore Q-table with proper defaultdict structure
-            self.q_table = defaultdict(lambda: defaultdict(float))
-            for state, actions in model_data["q_table"].items():
-                for action, q_value in actions.items():
-                    self.q_table[state][action] = q_value
+            if is_archive:
+                self.states = states
+                self.state_index = {state: i for i, state in enumerate(states)}
+                self.actions = actions
+                self.action_index = {action: i for i, action in enumerate(actions)}
+                self._grow_q_values(len(states), len(actions))
+                self.q_values[:len(states), :len(actions)] = q_values
+                self.known_actions[:len(states), :len(actions)] = known_actions
+            else:
+                # Older pickle files store {state: {action: q_value}}
+                for state, actions in model_data["q_table"].items():
+                    for action in actions:
+                        self._get_action_id(action)
+                for state, actions in model_data["q_table"].items():
+                    state_id = self._get_state_id(state)
+                    for action, q_value in actions.items():
+                        self.q_values[state_id, self.action_index[action]] = q_value
+                        self.known_actions[state_id, self.action_index[action]] = True
             
             # Restore other attributes
-            for attr in ["learning_rate", "discount_factor", "epsilon", "total_episodes", 
+            for attr in ["learning_rate", "discount_factor", "epsilon", "initial_epsilon", "total_episodes", 
                         "total_steps", "episode_rewards", "episode_lengths", "success_episodes"]:
                 if attr in model_data:
                     setattr(self, attr, model_data[attr])
@@ -389,7 +831,7 @@ class QLearningAgent:
             if self.debug:
                 print(f"📂 Model loaded from {filepath}")
                 print(f"   Episodes: {self.total_episodes}")
-                print(f"   Q-table entries: {len(self.q_table)}")
+                print(f"   Q-table entries: {self.num_states}")
             
             return True
             
@@ -404,6 +846,10 @@ class QLearningAgent:
             print("❌ Not enough data to plot (need at least 2 episodes)")
             return
         
+        # Imported here so training without plots doesn't load matplotlib/pandas
+        import matplotlib.pyplot as plt
+        import pandas as pd
+        
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         
         # Episode rewards over time
@@ -421,12 +867,9 @@ class QLearningAgent:
             ax1.legend()
         
         # Success rate over time
-        success_rate = []
         window_size = 10
-        for i in range(len(self.success_episodes)):
-            start_idx = max(0, i - window_size + 1)
-            window_successes = self.success_episodes[start_idx:i+1]
-            success_rate.append(sum(window_successes) / len(window_successes) * 100)
+        success_rate = pd.Series(self.success_episodes, dtype=float).rolling(
+            window=window_size, min_periods=1).mean() * 100
         
         ax2.plot(success_rate, 'g-', linewidth=2)
         ax2.set_title(f'Success Rate (Rolling {window_size}-episode window)')
@@ -443,11 +886,10 @@ class QLearningAgent:
         ax3.grid(True)
         
         # Exploration rate over time
-        exploration_rates = []
-        epsilon = 0.3  # Starting epsilon
-        for _ in range(self.total_episodes):
-            exploration_rates.append(epsilon)
-            epsilon = max(self.epsilon_min, epsilon * self.epsilon_decay)
+        exploration_rates = np.maximum(
+            self.epsilon_min,
+            self.initial_epsilon * self.epsilon_decay ** np.arange(self.total_episodes)
+        )
         
         ax4.plot(exploration_rates, 'purple', linewidth=2)
         ax4.set_title('Exploration Rate Over Time')
@@ -12,16 +12,25 @@ Think of it as giving the AI digital eyes!
 """
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import WebDriverException, NoSuchElementException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
+import itertools
+import re
+import sys
 import time
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from enum import Enum
 
+@lru_cache(maxsize=None)
+def _chromedriver_path() -> str:
+    """Locate (or download) chromedriver once per process"""
+    return ChromeDriverManager().install()
+
 class ElementType(Enum):
     """Types of elements the AI can interact with"""
     TEXT_INPUT = "text_input"
@@ -46,7 +55,10 @@ class ActionType(Enum):
     CLEAR = "clear"
     SUBMIT = "submit"
 
-@dataclass
+# __slots__ drop the per-instance __dict__ (dataclass support needs Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class WebElement:
     """Represents a web element the AI can interact with"""
     id: str
@@ -60,9 +72,11 @@ class WebElement:
     is_enabled: bool
     xpath: str
     css_selector: str
-    possible_actions: List[ActionType]
+    possible_actions: Tuple[ActionType, ...]
     coordinates: tuple  # (x, y) position
     size: tuple  # (width, height)
+    is_checked: Optional[bool] = None  # Checkbox/radio state when detected
+    handle: Any = field(default=None, repr=False, compare=False)  # Live Selenium element
     
     def __str__(self):
         return f"{self.element_type.value}[{self.id or 'no-id'}]: '{self.text or self.placeholder}'"
@@ -72,12 +86,173 @@ class ElementDetector:
     The AI's Web Scanner - Finds and analyzes all interactive elements
     """
     
+    # All potentially interactive elements
+    SELECTORS = [
+        "input",
+        "button", 
+        "select",
+        "textarea",
+        "a[href]",
+        "[onclick]",
+        "[role='button']"
+    ]
+    # The same selectors as one query, built once
+    SELECTOR_QUERY = ", ".join(SELECTORS)
+    
+    # Ids that can be used as "#id" in a CSS selector without escaping
+    CSS_SAFE_ID = re.compile(r'-?[A-Za-z_][\w-]*\Z')
+    
+    # Element type by <input type="..."> (anything else is a text input)
+    INPUT_TYPES = {
+        'email': ElementType.EMAIL_INPUT,
+        'password': ElementType.PASSWORD_INPUT,
+        'checkbox': ElementType.CHECKBOX,
+        'radio': ElementType.RADIO_BUTTON,
+        'submit': ElementType.SUBMIT_BUTTON
+    }
+    
+    # Element type by tag name, for tags that don't need a closer look
+    TAG_TYPES = {
+        'textarea': ElementType.TEXTAREA,
+        'select': ElementType.SELECT_DROPDOWN,
+        'a': ElementType.LINK
+    }
+    
+    # Page-side helpers, installed once per page as window.__detector so each
+    # step only sends a short call instead of the whole script source.
+    # scan() finds the candidates and describes the visible ones as plain
+    # data: a whole scan is one WebDriver call instead of ~10 per element.
+    DETECTOR_JS = """
+        window.__detector = (function () {
+            var xpaths = new Map();
+            
+            function xpathOf(el) {
+                if (el.id !== '') { return '//*[@id="' + el.id + '"]'; }
+                if (el === document.body) { return '/html/body'; }
+                if (!el.parentNode || el.parentNode.nodeType !== 1) { return '/' + el.tagName.toLowerCase(); }
+                // Elements in the same container share their parent's path,
+                // so each path is worked out once per scan
+                var path = xpaths.get(el);
+                if (path !== undefined) { return path; }
+                var ix = 0;
+                var siblings = el.parentNode.childNodes;
+                for (var i = 0; i < siblings.length; i++) {
+                    var sibling = siblings[i];
+                    if (sibling === el) {
+                        path = xpathOf(el.parentNode) + '/' + el.tagName.toLowerCase() + '[' + (ix + 1) + ']';
+                        break;
+                    }
+                    if (sibling.nodeType === 1 && sibling.tagName === el.tagName) { ix++; }
+                }
+                xpaths.set(el, path);
+                return path;
+            }
+            
+            function isVisible(el) {
+                if (el.getClientRects().length === 0 || el.getBoundingClientRect().width <= 0) { return false; }
+                var style = window.getComputedStyle(el);
+                return style.visibility !== 'hidden' && style.opacity !== '0';
+            }
+            
+            function describe(el) {
+                var rect = el.getBoundingClientRect();
+                return {
+                    handle: el,
+                    tag: el.tagName.toLowerCase(),
+                    id: el.id || '',
+                    type: el.type === undefined ? null : el.type,
+                    className: el.getAttribute('class'),
+                    text: (el.innerText || '').trim(),
+                    placeholder: el.getAttribute('placeholder') || '',
+                    value: el.value == null ? '' : String(el.value),
+                    checked: el.checked === undefined ? null : el.checked,
+                    required: el.hasAttribute('required'),
+                    enabled: !el.disabled,
+                    x: Math.round(rect.left + window.scrollX),
+                    y: Math.round(rect.top + window.scrollY),
+                    width: rect.width,
+                    height: rect.height,
+                    xpath: xpathOf(el)
+                };
+            }
+            
+            function scan(query) {
+                xpaths = new Map();
+                // One query for all selectors: a single DOM walk, and an
+                // element matching several selectors is only returned once
+                return {elements: visibleCandidates(query).map(describe)};
+            }
+            
+            function visibleCandidates(query) {
+                return Array.prototype.filter.call(document.querySelectorAll(query), isVisible);
+            }
+            
+            // Whether the success panel shows, and the page's own progress report
+            function formState() {
+                var panel = document.getElementById('successPanel');
+                return {
+                    success: !!panel && window.getComputedStyle(panel).display !== 'none'
+                        && panel.getClientRects().length > 0,
+                    formState: window.checkFormState ? window.checkFormState() : null
+                };
+            }
+            
+            function withFormState(result) {
+                var state = formState();
+                result.success = state.success;
+                result.formState = state.formState;
+                return result;
+            }
+            
+            return {
+                scan: scan,
+                formState: formState,
+                observe: function (query) { return withFormState(scan(query)); },
+                refresh: function (handles, query) {
+                    return withFormState({
+                        // Same filter as scan(), so elements that have appeared count too
+                        visible: visibleCandidates(query).length,
+                        fields: handles.map(function (el) {
+                            return [
+                                el.value === undefined ? null : el.value,
+                                el.isConnected && el.getClientRects().length > 0,
+                                !el.disabled,
+                                el.checked === undefined ? null : el.checked
+                            ];
+                        })
+                    });
+                }
+            };
+        })();
+    """
+    
+    # Calls one window.__detector helper; null means it isn't installed yet
+    CALL_DETECTOR_JS = """
+        var detector = window.__detector;
+        return detector ? detector[arguments[0]].apply(null, Array.prototype.slice.call(arguments, 1)) : null;
+    """
+    
+    # What the AI can do with each kind of element (shared, read-only)
+    _TEXT_ACTIONS = (ActionType.CLICK, ActionType.TYPE_TEXT, ActionType.CLEAR)
+    ACTIONS_BY_TYPE = {
+        ElementType.TEXT_INPUT: _TEXT_ACTIONS,
+        ElementType.EMAIL_INPUT: _TEXT_ACTIONS,
+        ElementType.PASSWORD_INPUT: _TEXT_ACTIONS,
+        ElementType.TEXTAREA: _TEXT_ACTIONS,
+        ElementType.SELECT_DROPDOWN: (ActionType.CLICK, ActionType.SELECT_OPTION),
+        ElementType.CHECKBOX: (ActionType.CHECK, ActionType.UNCHECK),
+        ElementType.BUTTON: (ActionType.CLICK,),
+        ElementType.LINK: (ActionType.CLICK,),
+        ElementType.SUBMIT_BUTTON: (ActionType.CLICK, ActionType.SUBMIT)
+    }
+    
     def __init__(self, headless: bool = False, debug: bool = True):
         """Initialize the web scanner"""
         self.debug = debug
         self.driver = None
         self.headless = headless
         self.detected_elements = []
+        self._visible_count = 0  # Elements described by the last scan
         
         # Sample text data for form filling
         self.sample_data = {
@@ -90,6 +265,7 @@ class ElementDetector:
                 'AI enthusiast with a passion for automation.'
             ]
         }
+        self._sample_cache = {}  # (element type, id) -> sample text
     
     def start_browser(self) -> bool:
         """Start the web browser"""
@@ -100,7 +276,7 @@ class ElementDetector:
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             
-            service = Service(ChromeDriverManager().install())
+            service = Service(_chromedriver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             
             if self.debug:
@@ -115,7 +291,10 @@ class ElementDetector:
         """Load a webpage"""
         try:
             self.driver.get(url)
-            time.sleep(2)  # Wait for page to load
+            # Wait for the page to finish loading rather than a fixed delay
+            WebDriverWait(self.driver, 10).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
             
             if self.debug:
                 print(f"✅ Page loaded: {url}")
@@ -125,6 +304,92 @@ class ElementDetector:
             print(f"❌ Failed to load page: {e}")
             return False
     
+    def reset_page(self) -> bool:
+        """
+        Put the page back into its initial state for a new episode.
+
+        Resetting the form with JavaScript is much cheaper than reloading
+        the whole page, so a full refresh is only used as a fallback.
+        """
+        reset_js = """
+            if (typeof window.resetForm === 'function') {
+                window.resetForm();
+            } else {
+                document.querySelectorAll('form').forEach(function (form) { form.reset(); });
+            }
+            var panel = document.getElementById('successPanel');
+            if (panel) { panel.style.display = 'none'; }
+        """
+        try:
+            self.driver.execute_script(reset_js)
+            self._wait_until_interactive()
+            return True
+        except Exception as e:
+            if self.debug:
+                print(f"⚠️  JS reset failed ({e}), falling back to page refresh")
+        
+        try:
+            self.driver.refresh()
+            self._wait_until_interactive()
+            return True
+        except Exception as e:
+            print(f"❌ Failed to reset page: {e}")
+            return False
+    
+    def recycle_tab(self) -> bool:
+        """
+        Swap the current tab for a fresh one showing the same page.
+
+        Scripts injected over many episodes leave listeners and garbage
+        behind; a new tab starts clean without restarting the browser.
+        """
+        try:
+            url = self.driver.current_url
+            old_tab = self.driver.current_window_handle
+            
+            # Open the new tab first - closing the last tab would end the session
+            self.driver.switch_to.new_window('tab')
+            new_tab = self.driver.current_window_handle
+            self.driver.switch_to.window(old_tab)
+            self.driver.close()
+            self.driver.switch_to.window(new_tab)
+            
+            self.driver.get(url)
+            self._wait_until_interactive()
+            
+            if self.debug:
+                print("♻️  Browser tab recycled")
+            return True
+            
+        except Exception as e:
+            print(f"⚠️  Could not recycle tab: {e}")
+            return False
+    
+    def _wait_until_interactive(self, timeout: float = 5):
+        """Wait until the form accepts input again"""
+        if not self._wait_for_selector("input", timeout):
+            raise TimeoutException(f"No usable input after {timeout}s")
+    
+    def _wait_for_selector(self, css: str, timeout: float) -> bool:
+        """
+        Wait until an element matching `css` is visible and enabled.
+        
+        The page checks every 50ms itself, so the wait is one WebDriver
+        call instead of a poll every 0.5s. Returns False on timeout.
+        """
+        wait_js = """
+            var css = arguments[0], limit = arguments[1];
+            var done = arguments[arguments.length - 1];
+            var start = Date.now();
+            (function poll() {
+                var el = document.querySelector(css);
+                if (el && !el.disabled && el.getClientRects().length > 0) { return done(true); }
+                if (Date.now() - start > limit) { return done(false); }
+                setTimeout(poll, 50);
+            })();
+        """
+        return bool(self.driver.execute_async_script(wait_js, css, int(timeout * 1000)))
+    
     def detect_elements(self) -> List[WebElement]:
         """
         Scan the page and find all interactive elements
@@ -135,29 +400,86 @@ class ElementDetector:
             return []
         
         print("\n🔍 AI is scanning the webpage...")
-        self.detected_elements = []
+        try:
+            scan = self._call_detector('scan', self.SELECTOR_QUERY)
+        except Exception as e:
+            if self.debug:
+                print(f"⚠️  Error scanning page: {e}")
+            return []
+        
+        return self._process_elements(scan['elements'])
+    
+    def detect_elements_and_state(self) -> Tuple[List[WebElement], Dict[str, Any]]:
+        """
+        Observe the page in a single WebDriver round-trip: the candidate
+        elements and the form completion state come back from one script.
+        """
+        if not self.driver:
+            print("❌ No browser session active!")
+            return [], {'completed': False, 'progress': 0, 'success': False, 'message': 'No browser'}
+        
+        print("\n🔍 AI is scanning the webpage...")
+        try:
+            observation = self._call_detector('observe', self.SELECTOR_QUERY)
+        except Exception as e:
+            if self.debug:
+                print(f"⚠️  Error observing page: {e}")
+            return [], {'completed': False, 'progress': 0, 'success': False, 'message': f'Error: {e}'}
+        
+        elements = self._process_elements(observation['elements'])
+        form_state = self._build_form_state(observation['success'], observation['formState'])
+        return elements, form_state
+    
+    def refresh_elements_and_state(self, elements: List[WebElement]) -> Tuple[List[WebElement], Dict[str, Any]]:
+        """
+        Re-observe a page whose structure is already known.
+
+        Only the fields that change while filling a form (value, visibility,
+        enabled, checked) are fetched for the elements found earlier. If the page
+        structure changed, a full scan is done instead.
+        """
+        if not elements:
+            return self.detect_elements_and_state()
+        
+        try:
+            observation = self._call_detector(
+                'refresh', [elem.handle for elem in elements], self.SELECTOR_QUERY
+            )
+        except Exception:
+            # Stale handles mean the DOM was rebuilt
+            return self.detect_elements_and_state()
         
-        # Find all potentially interactive elements
-        selectors = [
-            "input",
-            "button", 
-            "select",
-            "textarea",
-            "a[href]",
-            "[onclick]",
-            "[role='button']"
+        fields = observation['fields']
+        if observation['visible'] != self._visible_count or not all(visible for _, visible, _, _ in fields):
+            return self.detect_elements_and_state()
+        
+        self.detected_elements = [
+            replace(elem, value=value or "", is_enabled=enabled, is_checked=checked)
+            for elem, (value, _, enabled, checked) in zip(elements, fields)
         ]
+        form_state = self._build_form_state(observation['success'], observation['formState'])
+        return self.detected_elements, form_state
+    
+    def _call_detector(self, method: str, *args):
+        """
+        Run one of the DETECTOR_JS helpers in the page.
         
-        for selector in selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for elem in elements:
-                    web_element = self._analyze_element(elem)
-                    if web_element and web_element.is_visible:
-                        self.detected_elements.append(web_element)
-            except Exception as e:
-                if self.debug:
-                    print(f"⚠️  Error scanning {selector}: {e}")
+        The helpers are installed on first use and again whenever the page
+        has lost them (navigation, refresh, a recycled tab).
+        """
+        result = self.driver.execute_script(self.CALL_DETECTOR_JS, method, *args)
+        if result is None:
+            self.driver.execute_script(self.DETECTOR_JS)
+            result = self.driver.execute_script(self.CALL_DETECTOR_JS, method, *args)
+        return result
+    
+    def _process_elements(self, described: list) -> List[WebElement]:
+        """Build WebElements from the scan script's descriptions of visible elements"""
+        # Elements without an id are numbered in document order, which keeps
+        # their ids (and so the agent's action names) stable between scans
+        unnamed = itertools.count(1)
+        self.detected_elements = [self._build_element(info, unnamed) for info in described]
+        self._visible_count = len(described)
         
         # Sort by position (top to bottom, left to right)
         self.detected_elements.sort(key=lambda x: (x.coordinates[1], x.coordinates[0]))
@@ -168,155 +490,69 @@ class ElementDetector:
         
         return self.detected_elements
     
-    def _analyze_element(self, elem) -> Optional[WebElement]:
-        """Analyze a single element and extract its properties"""
-        try:
-            # Get basic properties
-            tag_name = elem.tag_name.lower()
-            element_id = elem.get_attribute('id') or f"elem_{hash(elem)}"
-            text = elem.text.strip()
-            placeholder = elem.get_attribute('placeholder') or ""
-            value = elem.get_attribute('value') or ""
-            is_required = elem.get_attribute('required') is not None
-            
-            # Check visibility and interaction ability
-            is_visible = elem.is_displayed() and elem.size['width'] > 0
-            is_enabled = elem.is_enabled()
-            
-            if not is_visible:
-                return None
-            
-            # Get position and size
-            location = elem.location
-            size = elem.size
-            coordinates = (location['x'], location['y'])
-            element_size = (size['width'], size['height'])
-            
-            # Generate selectors
-            xpath = self._generate_xpath(elem)
-            css_selector = self._generate_css_selector(elem)
-            
-            # Determine element type and possible actions
-            element_type = self._classify_element(elem, tag_name)
-            possible_actions = self._determine_actions(element_type, elem)
-            
-            return WebElement(
-                id=element_id,
-                element_type=element_type,
-                tag_name=tag_name,
-                text=text,
-                placeholder=placeholder,
-                value=value,
-                is_required=is_required,
-                is_visible=is_visible,
-                is_enabled=is_enabled,
-                xpath=xpath,
-                css_selector=css_selector,
-                possible_actions=possible_actions,
-                coordinates=coordinates,
-                size=element_size
-            )
-            
-        except Exception as e:
-            if self.debug:
-                print(f"⚠️  Error analyzing element: {e}")
-            return None
+    def _build_element(self, info: Dict[str, Any], unnamed: Iterator[int]) -> WebElement:
+        """Turn one element description from the page's scan() into a WebElement"""
+        # Tag names and short placeholders repeat across elements and scans;
+        # interning lets them share one string object
+        tag_name = sys.intern(info['tag'])
+        placeholder = info['placeholder']
+        if len(placeholder) < 32:
+            placeholder = sys.intern(placeholder)
+        elem = info['handle']
+        
+        # Determine element type and possible actions
+        element_type = self._classify_element(tag_name, info['type'])
+        possible_actions = self._determine_actions(element_type, elem)
+        
+        return WebElement(
+            id=info['id'] or f"elem_{next(unnamed)}",
+            element_type=element_type,
+            tag_name=tag_name,
+            text=info['text'],
+            placeholder=placeholder,
+            value=info['value'],
+            is_checked=info['checked'],
+            is_required=info['required'],
+            is_visible=True,  # scan() only describes visible elements
+            is_enabled=info['enabled'],
+            xpath=info['xpath'],
+            css_selector=self._generate_css_selector(tag_name, info['id'], info['className']),
+            possible_actions=possible_actions,
+            coordinates=(info['x'], info['y']),
+            size=(info['width'], info['height']),
+            handle=elem
+        )
     
-    def _classify_element(self, elem, tag_name: str) -> ElementType:
-        """Determine what type of element this is"""
+    def _classify_element(self, tag_name: str, type_attr: Optional[str]) -> ElementType:
+        """Determine what type of element this is (type_attr is the element's type property)"""
         if tag_name == "input":
-            input_type = elem.get_attribute('type') or 'text'
-            
-            if input_type == 'email':
-                return ElementType.EMAIL_INPUT
-            elif input_type == 'password':
-                return ElementType.PASSWORD_INPUT
-            elif input_type == 'checkbox':
-                return ElementType.CHECKBOX
-            elif input_type == 'radio':
-                return ElementType.RADIO_BUTTON
-            elif input_type == 'submit':
-                return ElementType.SUBMIT_BUTTON
-            else:
-                return ElementType.TEXT_INPUT
-                
-        elif tag_name == "textarea":
-            return ElementType.TEXTAREA
-        elif tag_name == "select":
-            return ElementType.SELECT_DROPDOWN
-        elif tag_name == "button":
-            button_type = elem.get_attribute('type')
-            if button_type == 'submit':
+            return self.INPUT_TYPES.get(type_attr or 'text', ElementType.TEXT_INPUT)
+        
+        if tag_name == "button":
+            if type_attr == 'submit':
                 return ElementType.SUBMIT_BUTTON
             return ElementType.BUTTON
-        elif tag_name == "a":
-            return ElementType.LINK
-        else:
-            return ElementType.UNKNOWN
+        
+        return self.TAG_TYPES.get(tag_name, ElementType.UNKNOWN)
     
-    def _determine_actions(self, element_type: ElementType, elem) -> List[ActionType]:
+    def _determine_actions(self, element_type: ElementType, elem) -> Tuple[ActionType, ...]:
         """Determine what actions the AI can perform on this element"""
-        actions = []
-        
-        if element_type in [ElementType.TEXT_INPUT, ElementType.EMAIL_INPUT, 
-                           ElementType.PASSWORD_INPUT, ElementType.TEXTAREA]:
-            actions.extend([ActionType.CLICK, ActionType.TYPE_TEXT, ActionType.CLEAR])
-            
-        elif element_type == ElementType.SELECT_DROPDOWN:
-            actions.extend([ActionType.CLICK, ActionType.SELECT_OPTION])
-            
-        elif element_type == ElementType.CHECKBOX:
-            actions.extend([ActionType.CHECK, ActionType.UNCHECK])
-            
-        elif element_type in [ElementType.BUTTON, ElementType.SUBMIT_BUTTON, ElementType.LINK]:
-            actions.append(ActionType.CLICK)
-            if element_type == ElementType.SUBMIT_BUTTON:
-                actions.append(ActionType.SUBMIT)
-        
-        return actions
+        return self.ACTIONS_BY_TYPE.get(element_type, ())
     
-    def _generate_xpath(self, elem) -> str:
-        """Generate XPath for the element"""
-        try:
-            return self.driver.execute_script(
-                "function getXPath(element) {"
-                "  if (element.id !== '') {"
-                "    return '//*[@id=\"' + element.id + '\"]';"
-                "  }"
-                "  if (element === document.body) {"
-                "    return '/html/body';"
-                "  }"
-                "  var ix = 0;"
-                "  var siblings = element.parentNode.childNodes;"
-                "  for (var i = 0; i < siblings.length; i++) {"
-                "    var sibling = siblings[i];"
-                "    if (sibling === element) {"
-                "      return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';"
-                "    }"
-                "    if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {"
-                "      ix++;"
-                "    }"
-                "  }"
-                "}"
-                "return getXPath(arguments[0]);", elem)
-        except:
-            return f"//{elem.tag_name}[{hash(elem)}]"
-    
-    def _generate_css_selector(self, elem) -> str:
+    def _generate_css_selector(self, tag_name: str, element_id: str, class_name: Optional[str]) -> str:
         """Generate CSS selector for the element"""
-        try:
-            element_id = elem.get_attribute('id')
-            if element_id:
+        if element_id:
+            if self.CSS_SAFE_ID.match(element_id):
                 return f"#{element_id}"
-            
-            class_name = elem.get_attribute('class')
-            if class_name:
-                classes = '.'.join(class_name.split())
-                return f"{elem.tag_name}.{classes}"
-            
-            return elem.tag_name
-        except:
-            return elem.tag_name
+            # Ids like "2fa" or "user:name" aren't valid after '#'
+            quoted = element_id.replace('\\', '\\\\').replace('"', '\\"')
+            return f'{tag_name}[id="{quoted}"]'
+        
+        if class_name and class_name.split():
+            classes = '.'.join(class_name.split())
+            return f"{tag_name}.{classes}"
+        
+        return tag_name
     
     def _print_element_summary(self):
         """Print a summary of detected elements"""
@@ -335,51 +571,57 @@ class ElementDetector:
             print()
     
     def get_sample_data_for_element(self, element: WebElement) -> str:
-        """Get appropriate sample data for an element"""
+        """Get appropriate sample data for an element (worked out once per element)"""
+        key = (element.element_type, element.id)
+        sample = self._sample_cache.get(key)
+        if sample is not None:
+            return sample
+        
         elem_type = element.element_type
         
         if elem_type == ElementType.EMAIL_INPUT:
-            return self.sample_data['emails'][0]
+            sample = self.sample_data['emails'][0]
         elif elem_type in [ElementType.TEXT_INPUT] and 'name' in element.id.lower():
-            return self.sample_data['names'][0]
+            sample = self.sample_data['names'][0]
         elif elem_type == ElementType.TEXTAREA:
-            return self.sample_data['descriptions'][0]
+            sample = self.sample_data['descriptions'][0]
         else:
-            return "Sample text"
+            sample = "Sample text"
+        
+        self._sample_cache[key] = sample
+        return sample
     
     def get_form_completion_state(self) -> Dict[str, Any]:
         """Check how much of the form is completed - this will be our reward signal!"""
         try:
-            # Check if success panel is visible (our ultimate goal!)
-            success_panel = self.driver.find_element(By.ID, "successPanel")
-            if success_panel.is_displayed():
-                return {
-                    'completed': True,
-                    'progress': 100,
-                    'success': True,
-                    'message': '🎉 GOAL ACHIEVED! Success panel is visible!'
-                }
-            
-            # Get progress from the webpage
-            progress_js = """
-                return window.checkFormState ? window.checkFormState() : null;
-            """
-            form_state = self.driver.execute_script(progress_js)
-            
-            if form_state:
-                return {
-                    'completed': form_state.get('isComplete', False),
-                    'progress': form_state.get('progress', 0),
-                    'success': False,
-                    'values': form_state.get('values', {}),
-                    'message': f"Form {form_state.get('progress', 0):.0f}% complete"
-                }
-            
-            return {'completed': False, 'progress': 0, 'success': False, 'message': 'No progress detected'}
+            # Success panel and progress come back from one script
+            state = self._call_detector('formState')
+            return self._build_form_state(state['success'], state['formState'])
             
         except Exception as e:
             return {'completed': False, 'progress': 0, 'success': False, 'message': f'Error: {e}'}
     
+    def _build_form_state(self, success: bool, form_state: Optional[Dict]) -> Dict[str, Any]:
+        """Turn raw page state into the reward-signal dictionary"""
+        if success:
+            return {
+                'completed': True,
+                'progress': 100,
+                'success': True,
+                'message': '🎉 GOAL ACHIEVED! Success panel is visible!'
+            }
+        
+        if form_state:
+            return {
+                'completed': form_state.get('isComplete', False),
+                'progress': form_state.get('progress', 0),
+                'success': False,
+                'values': form_state.get('values', {}),
+                'message': f"Form {form_state.get('progress', 0):.0f}% complete"
+            }
+        
+        return {'completed': False, 'progress': 0, 'success': False, 'message': 'No progress detected'}
+    
     def close(self):
         """Clean up and close the browser"""
         if self.driver:
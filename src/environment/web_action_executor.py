@@ -13,27 +13,45 @@ Think of it as giving the AI hands to interact with the web!
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import (
-    NoSuchElementException, TimeoutException, 
-    ElementClickInterceptedException, StaleElementReferenceException
+    NoSuchElementException, InvalidSelectorException, TimeoutException,
+    StaleElementReferenceException, WebDriverException
 )
 import time
 import random
-from typing import Dict, Any, Tuple, Optional
+from collections import Counter, deque
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
-from enum import Enum
+from functools import lru_cache
+from enum import IntEnum
+from types import MappingProxyType
 
-class ActionResult(Enum):
+# Sample data for form filling
+SAMPLE_DATA = MappingProxyType({
+    'names': ('John Doe', 'Jane Smith', 'Alex Johnson', 'Sarah Wilson'),
+    'emails': ('john.doe@example.com', 'jane.smith@demo.com', 'alex.j@test.org'),
+    'ages': ('18-25', '26-35', '36-45', '46+'),
+    'descriptions': (
+        'I am passionate about artificial intelligence and machine learning.',
+        'Looking forward to exploring new technologies and innovations.',
+        'Excited to participate in this AI training demonstration.',
+        'Interested in automation and intelligent systems.'
+    )
+})
+
+class ActionResult(IntEnum):
     """Possible outcomes when the AI tries to perform an action"""
-    SUCCESS = "success"
-    FAILED = "failed"
-    ELEMENT_NOT_FOUND = "element_not_found"
-    ELEMENT_NOT_INTERACTABLE = "element_not_interactable"
-    TIMEOUT = "timeout"
-    ALREADY_COMPLETED = "already_completed"
+    SUCCESS = 1
+    FAILED = 2
+    ELEMENT_NOT_FOUND = 3
+    ELEMENT_NOT_INTERACTABLE = 4
+    TIMEOUT = 5
+    ALREADY_COMPLETED = 6
+    
+    @property
+    def label(self) -> str:
+        """Readable name for logs and history, e.g. 'element_not_found'"""
+        return self.name.lower()
 
 @dataclass
 class ExecutionResult:
@@ -51,6 +69,130 @@ class WebActionExecutor:
     The AI's Hands - Executes actions on webpages
     """
     
+    # Page-side helpers, installed once per page as window.__executor so each
+    # action only sends a short call instead of the whole script source
+    # (the same approach as ElementDetector.DETECTOR_JS).
+    EXECUTOR_JS = """
+        window.__executor = (function () {
+            function fire(el, type) {
+                el.dispatchEvent(new Event(type, {bubbles: true}));
+            }
+            
+            // Scrolls an element into view and clicks it, unless it is disabled
+            // or covered by another element
+            function click(el) {
+                if (el.disabled) { return 'disabled'; }
+                el.scrollIntoView({block: 'center'});
+                var rect = el.getBoundingClientRect();
+                var top = document.elementFromPoint(rect.left + rect.width / 2, rect.top + rect.height / 2);
+                if (top && top !== el && !el.contains(top) && !top.contains(el)) { return 'intercepted'; }
+                el.click();
+                return 'clicked';
+            }
+            
+            // Clicks a checkbox unless it is already in the wanted state
+            function toggle(el, want) {
+                if (el.checked === want) { return {changed: false, checked: el.checked}; }
+                el.click();
+                return {changed: true, checked: el.checked};
+            }
+            
+            // Non-empty option values of a <select>
+            function options(el) {
+                return Array.prototype.map.call(el.options || [], function (o) {
+                    return o.value;
+                }).filter(Boolean);
+            }
+            
+            // Runs one batch step {op, el, ...}. The status is 'missing', 'error'
+            // (with error), a click() outcome, 'unchanged' (nothing to do) or
+            // 'done' (with the value set, for type/select, or the toggle outcome)
+            function runStep(step) {
+                var el = step.el;
+                if (!el || !el.isConnected) { return {status: 'missing'}; }
+                try {
+                    switch (step.op) {
+                        case 'click':
+                            return {status: click(el)};
+                        case 'type':
+                            if (el.value.trim() && el.value.trim() === step.expect) {
+                                return {status: 'unchanged'};
+                            }
+                            el.value = step.text;
+                            fire(el, 'input');
+                            fire(el, 'change');
+                            return {status: 'done', value: step.text};
+                        case 'select':
+                            var values = options(el);
+                            if (!values.length) { return {status: 'unchanged'}; }
+                            var value = values.indexOf(step.value) >= 0 ?
+                                step.value : values[Math.floor(step.pick * values.length)];
+                            el.value = value;
+                            fire(el, 'change');
+                            return {status: 'done', value: value};
+                        case 'check':
+                        case 'uncheck':
+                            var outcome = toggle(el, step.op === 'check');
+                            return {status: 'done', changed: outcome.changed, checked: outcome.checked};
+                        case 'clear':
+                            if (!el.value.trim()) { return {status: 'unchanged'}; }
+                            el.value = '';
+                            fire(el, 'input');
+                            fire(el, 'change');
+                            return {status: 'done'};
+                    }
+                    return {status: 'error', error: 'unknown action ' + step.op};
+                } catch (e) {
+                    return {status: 'error', error: String(e)};
+                }
+            }
+            
+            // Calls done() once the DOM has had no mutations for `quiet` ms,
+            // or after `limit` ms
+            function settle(quiet, limit, done) {
+                var timer, cap;
+                var observer = new MutationObserver(function () {
+                    clearTimeout(timer);
+                    timer = setTimeout(finish, quiet);
+                });
+                function finish() {
+                    observer.disconnect();
+                    clearTimeout(timer);
+                    clearTimeout(cap);
+                    done(document.readyState === 'complete');
+                }
+                observer.observe(document, {
+                    subtree: true, childList: true, attributes: true, characterData: true
+                });
+                timer = setTimeout(finish, quiet);
+                cap = setTimeout(finish, limit);
+            }
+            
+            return {
+                click: click,
+                options: options,
+                toggle: toggle,
+                batch: function (steps) { return steps.map(runStep); },
+                settle: settle
+            };
+        })();
+    """
+    
+    # Calls one window.__executor helper; null means it isn't installed yet
+    CALL_EXECUTOR_JS = """
+        var executor = window.__executor;
+        return executor ? executor[arguments[0]].apply(null, Array.prototype.slice.call(arguments, 1)) : null;
+    """
+    
+    # Async version for settle(); reports null if the helpers aren't installed
+    SETTLE_CALL_JS = """
+        var done = arguments[arguments.length - 1];
+        var executor = window.__executor;
+        if (!executor) { return done(null); }
+        executor.settle(arguments[0], arguments[1], done);
+    """
+    SETTLE_QUIET_MS = 100
+    
     def __init__(self, driver, debug: bool = True):
         """
         Initialize the action executor
@@ -63,23 +205,20 @@ class WebActionExecutor:
         self.debug = debug
         self.wait = WebDriverWait(driver, 5)  # 5 second timeout
         
-        # Track action history
-        self.action_history = []
-        self.successful_actions = 0
-        self.failed_actions = 0
-        
-        # Sample data for form filling
-        self.sample_data = {
-            'names': ['John Doe', 'Jane Smith', 'Alex Johnson', 'Sarah Wilson'],
-            'emails': ['john.doe@example.com', 'jane.smith@demo.com', 'alex.j@test.org'],
-            'ages': ['18-25', '26-35', '36-45', '46+'],
-            'descriptions': [
-                'I am passionate about artificial intelligence and machine learning.',
-                'Looking forward to exploring new technologies and innovations.',
-                'Excited to participate in this AI training demonstration.',
-                'Interested in automation and intelligent systems.'
-            ]
-        }
+        # Track action history (only the most recent actions are kept;
+        # the outcome counts below cover the whole run)
+        self.action_history = deque(maxlen=1000)
+        self.result_counts = Counter()
+        
+        # id -> element index for the most recent elements list
+        self._indexed_elements = None
+        self._elements_by_id = {}
+        
+        # Sample data for form filling (shared, read-only)
+        self.sample_data = SAMPLE_DATA
+        
+        # Own random generator, so executors don't share the global one
+        self._rng = random.Random()
         
         if self.debug:
             print("🤲 Web Action Executor initialized!")
@@ -95,68 +234,30 @@ class WebActionExecutor:
         Returns:
             ExecutionResult with outcome details
         """
-        start_time = time.time()
-        
-        # Parse the action string
-        action_parts = action_string.split('_', 2)
-        if len(action_parts) < 2:
-            return self._create_result(
-                ActionResult.FAILED,
-                f"Invalid action format: {action_string}",
-                -0.5, False, "", "invalid", start_time
-            )
+        start_time = time.perf_counter()
         
-        action_type = action_parts[0]
-        element_id = action_parts[1]
-        value = action_parts[2] if len(action_parts) > 2 else ""
+        # Parse the action string and find the target element
+        action_type, element_id, value, target_element, error = self._resolve_action(
+            action_string, elements, start_time
+        )
+        if error:
+            return error
         
         if self.debug:
             print(f"\n🎯 Executing: {action_type.upper()} on '{element_id}' with value '{value}'")
         
-        # Find the target element
-        target_element = self._find_element_by_id(element_id, elements)
-        if not target_element:
-            return self._create_result(
-                ActionResult.ELEMENT_NOT_FOUND,
-                f"Element '{element_id}' not found",
-                -0.2, False, element_id, action_type, start_time
-            )
-        
         # Execute the specific action
         try:
-            if action_type == "click":
-                result = self._execute_click(target_element, element_id)
-            elif action_type == "type":
-                result = self._execute_type(target_element, element_id, value)
-            elif action_type == "select":
-                result = self._execute_select(target_element, element_id, value)
-            elif action_type == "check":
-                result = self._execute_check(target_element, element_id, True)
-            elif action_type == "uncheck":
-                result = self._execute_check(target_element, element_id, False)
-            elif action_type == "clear":
-                result = self._execute_clear(target_element, element_id)
-            else:
-                result = self._create_result(
-                    ActionResult.FAILED,
-                    f"Unknown action type: {action_type}",
-                    -0.3, False, element_id, action_type, start_time
-                )
-            
-            # Track success/failure
-            if result.result == ActionResult.SUCCESS:
-                self.successful_actions += 1
-            else:
-                self.failed_actions += 1
-            
-            # Add to history
-            self.action_history.append({
-                'action': action_string,
-                'result': result.result.value,
-                'reward': result.reward,
-                'timestamp': time.time()
-            })
-            
+            try:
+                result = self._dispatch_action(action_type, target_element, element_id,
+                                               value, start_time)
+            except StaleElementReferenceException:
+                # The cached handle went stale (page re-rendered) - look it up again
+                target_element.handle = None
+                result = self._dispatch_action(action_type, target_element, element_id,
+                                               value, start_time)
+            
+            self._record_result(action_string, result)
             return result
             
         except Exception as e:
@@ -169,104 +270,235 @@ class WebActionExecutor:
                 -0.5, False, element_id, action_type, start_time
             )
     
+    def execute_batch(self, action_strings: List[str], elements: list) -> List[ExecutionResult]:
+        """
+        Execute several actions in a single round-trip to the browser
+        
+        The actions run in order inside the page, so a plan of N actions costs
+        one WebDriver call (plus one settle wait at the end) instead of several
+        per action. Text is set through the field's value and input/change
+        events rather than typed key by key. Rewards and messages are the same
+        as for execute_action.
+        
+        Args:
+            action_strings: Actions in format "action_type_element_id_value"
+            elements: List of detected web elements
+            
+        Returns:
+            One ExecutionResult per action, in the same order
+        """
+        start_time = time.perf_counter()
+        results: List[Optional[ExecutionResult]] = [None] * len(action_strings)
+        plan = []  # (position, action_type, element_id, target_element, step)
+        
+        for position, action_string in enumerate(action_strings):
+            action_type, element_id, value, target_element, error = self._resolve_action(
+                action_string, elements, start_time
+            )
+            if error is None and action_type not in self.ACTION_HANDLERS:
+                error = self._unknown_action_result(action_type, element_id, start_time)
+            if error:
+                results[position] = error
+            else:
+                step = self._plan_step(action_type, target_element, value)
+                plan.append((position, action_type, element_id, target_element, step))
+        
+        if plan:
+            if self.debug:
+                print(f"\n🎯 Executing batch of {len(plan)} actions")
+            
+            try:
+                try:
+                    outcomes = self._run_batch(plan)
+                except StaleElementReferenceException:
+                    # Some cached handles went stale (page re-rendered) - look them up again
+                    for _, _, _, target_element, _ in plan:
+                        target_element.handle = None
+                    outcomes = self._run_batch(plan)
+            except Exception as e:
+                if self.debug:
+                    print(f"❌ Unexpected error: {e}")
+                outcomes = [{'status': 'error', 'error': str(e)}] * len(plan)
+            
+            # One settle wait for the whole batch
+            if any(outcome['status'] in ('clicked', 'done') for outcome in outcomes):
+                self._wait_for_settle(1.0)
+            
+            for (position, action_type, element_id, target_element, _), outcome in zip(plan, outcomes):
+                results[position] = self._batch_step_result(
+                    action_type, element_id, target_element, outcome, start_time
+                )
+        
+        for action_string, result in zip(action_strings, results):
+            self._record_result(action_string, result)
+        
+        return results
+    
+    def _resolve_action(self, action_string: str, elements: list, start_time: float):
+        """
+        Split an action string and find its element
+        
+        Returns (action_type, element_id, value, element, error); error is a
+        failed ExecutionResult when the action can't be run, else None.
+        """
+        action_type, separator, rest = action_string.partition('_')
+        if not separator:
+            error = self._create_result(
+                ActionResult.FAILED,
+                f"Invalid action format: {action_string}",
+                -0.5, False, "", "invalid", start_time
+            )
+            return "invalid", "", "", None, error
+        
+        element_id, _, value = rest.partition('_')
+        
+        target_element = self._find_element_by_id(element_id, elements)
+        if not target_element:
+            error = self._create_result(
+                ActionResult.ELEMENT_NOT_FOUND,
+                f"Element '{element_id}' not found",
+                -0.2, False, element_id, action_type, start_time
+            )
+            return action_type, element_id, value, None, error
+        
+        return action_type, element_id, value, target_element, None
+    
+    def _record_result(self, action_string: str, result: ExecutionResult):
+        """Count an action's outcome and add it to the history"""
+        self.result_counts[result.result] += 1
+        
+        self.action_history.append({
+            'action': action_string,
+            'result': result.result.label,
+            'reward': result.reward,
+            'timestamp': time.time()
+        })
+    
+    def _plan_step(self, action_type: str, web_element, value: str) -> Dict[str, Any]:
+        """The page-side description of one batch action (without its element)"""
+        if action_type == "type":
+            # Same "already filled" test as _execute_type, against the requested text
+            return {'op': 'type', 'text': self._get_appropriate_value(web_element, value),
+                    'expect': value.replace('_', ' ')}
+        if action_type == "select":
+            # The random pick is drawn here so it comes from this executor's generator
+            return {'op': 'select', 'value': value, 'pick': self._rng.random()}
+        return {'op': action_type}
+    
+    def _run_batch(self, plan) -> List[Dict[str, Any]]:
+        """Send the planned steps to the page and return its per-step outcomes"""
+        steps = []
+        for _, _, _, target_element, step in plan:
+            steps.append(dict(step, el=self._find_selenium_element(target_element)))
+        return self._call_page('batch', steps)
+    
+    def _batch_step_result(self, action_type: str, element_id: str, web_element,
+                           outcome: Dict[str, Any], start_time: float) -> ExecutionResult:
+        """Turn one in-page batch outcome into the result execute_action would give"""
+        status = outcome['status']
+        kind = "check" if action_type == "uncheck" else action_type
+        
+        if status == 'missing':
+            return self._not_located_result(element_id, kind, start_time)
+        if status == 'error':
+            return self._failed_result(element_id, kind, outcome.get('error'), start_time)
+        
+        if action_type == "click":
+            return self._click_result(web_element, element_id, status, start_time)
+        if action_type == "type":
+            typed_value = outcome.get('value') if status == 'done' else None
+            return self._type_result(web_element, element_id, typed_value, start_time)
+        if action_type == "select":
+            return self._select_result(web_element, element_id, outcome.get('value'), start_time)
+        if action_type == "clear":
+            return self._clear_result(web_element, element_id, status == 'done', start_time)
+        return self._check_result(web_element, element_id, action_type == "check", outcome, start_time)
+    
+    def _dispatch_action(self, action_type: str, target_element, element_id: str,
+                         value: str, start_time: float) -> ExecutionResult:
+        """Run the executor method for an action type"""
+        handler = self.ACTION_HANDLERS.get(action_type)
+        if handler is None:
+            return self._unknown_action_result(action_type, element_id, start_time)
+        
+        return handler(self, target_element, element_id, value, start_time)
+    
+    def _unknown_action_result(self, action_type: str, element_id: str,
+                               start_time: float) -> ExecutionResult:
+        """Result for an action type there is no handler for"""
+        return self._create_result(
+            ActionResult.FAILED,
+            f"Unknown action type: {action_type}",
+            -0.3, False, element_id, action_type, start_time
+        )
+    
     def _find_element_by_id(self, element_id: str, elements: list):
         """Find an element in the detected elements list"""
-        for elem in elements:
-            if elem.id == element_id:
-                return elem
-        return None
+        # The detector returns a new list per scan, so index each list once
+        if elements is not self._indexed_elements:
+            self._elements_by_id = {}
+            for elem in elements:
+                self._elements_by_id.setdefault(elem.id, elem)
+            self._indexed_elements = elements
+        
+        return self._elements_by_id.get(element_id)
     
     def _find_selenium_element(self, web_element):
         """Find the actual Selenium element on the page"""
-        try:
-            # Try by ID first
-            if web_element.id and web_element.id != "elem_":
-                return self.driver.find_element(By.ID, web_element.id)
-            
-            # Try by CSS selector
-            if web_element.css_selector:
-                return self.driver.find_element(By.CSS_SELECTOR, web_element.css_selector)
-            
-            # Try by XPath
-            if web_element.xpath:
-                return self.driver.find_element(By.XPATH, web_element.xpath)
-            
-            return None
-            
-        except NoSuchElementException:
+        # Reuse the live element the detector already found, if any
+        if getattr(web_element, 'handle', None) is not None:
+            return web_element.handle
+        
+        # The CSS selector is "#id" for elements with a usable id, so one
+        # lookup usually does it; the XPath only runs if that finds nothing
+        selenium_element = None
+        for by, locator in ((By.CSS_SELECTOR, web_element.css_selector), (By.XPATH, web_element.xpath)):
+            if not locator:
+                continue
+            try:
+                selenium_element = self.driver.find_element(by, locator)
+                break
+            except (NoSuchElementException, InvalidSelectorException):
+                continue
+        
+        if selenium_element is None:
             return None
+        
+        # Remember the fresh element so later actions on this element skip the lookup
+        web_element.handle = selenium_element
+        return selenium_element
     
-    def _execute_click(self, web_element, element_id: str) -> ExecutionResult:
+    def _execute_click(self, web_element, element_id: str, start_time: float) -> ExecutionResult:
         """Execute a click action"""
         try:
             selenium_element = self._find_selenium_element(web_element)
             if not selenium_element:
-                return self._create_result(
-                    ActionResult.ELEMENT_NOT_FOUND,
-                    f"Could not locate element '{element_id}' on page",
-                    -0.2, False, element_id, "click", time.time()
-                )
-            
-            # Check if element is clickable
-            if not selenium_element.is_enabled():
-                return self._create_result(
-                    ActionResult.ELEMENT_NOT_INTERACTABLE,
-                    f"Element '{element_id}' is not clickable",
-                    -0.1, False, element_id, "click", time.time()
-                )
-            
-            # Scroll element into view
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", selenium_element)
-            time.sleep(0.2)
+                return self._not_located_result(element_id, "click", start_time)
             
-            # Perform the click
-            selenium_element.click()
-            time.sleep(0.5)  # Wait for any page changes
-            
-            if self.debug:
-                print(f"✅ Successfully clicked '{element_id}'")
+            # Check, scroll into view and click in one call
+            outcome = self._call_page('click', selenium_element)
+            if outcome == 'clicked':
+                self._wait_for_settle(1.0)  # Clicks may submit or re-render the page
             
-            # Calculate reward based on element type
-            reward = self._calculate_click_reward(web_element)
-            
-            return self._create_result(
-                ActionResult.SUCCESS,
-                f"Clicked '{element_id}' successfully",
-                reward, True, element_id, "click", time.time()
-            )
+            return self._click_result(web_element, element_id, outcome, start_time)
             
-        except ElementClickInterceptedException:
-            return self._create_result(
-                ActionResult.ELEMENT_NOT_INTERACTABLE,
-                f"Click on '{element_id}' was intercepted",
-                -0.1, False, element_id, "click", time.time()
-            )
+        except StaleElementReferenceException:
+            raise  # Retried with a fresh lookup by execute_action
         except Exception as e:
-            return self._create_result(
-                ActionResult.FAILED,
-                f"Click failed: {str(e)}",
-                -0.2, False, element_id, "click", time.time()
-            )
+            return self._failed_result(element_id, "click", e, start_time)
     
-    def _execute_type(self, web_element, element_id: str, value: str) -> ExecutionResult:
+    def _execute_type(self, web_element, element_id: str, value: str,
+                      start_time: float) -> ExecutionResult:
         """Execute a text input action"""
         try:
             selenium_element = self._find_selenium_element(web_element)
             if not selenium_element:
-                return self._create_result(
-                    ActionResult.ELEMENT_NOT_FOUND,
-                    f"Could not locate input '{element_id}'",
-                    -0.2, False, element_id, "type", time.time()
-                )
+                return self._not_located_result(element_id, "type", start_time)
             
-            # Check if already filled
-            current_value = selenium_element.get_attribute('value') or ""
+            # Check if already filled (using the value seen by the detector)
+            current_value = self._current_value(web_element, selenium_element)
             if current_value.strip() and current_value.strip() == value.replace('_', ' '):
-                return self._create_result(
-                    ActionResult.ALREADY_COMPLETED,
-                    f"Field '{element_id}' already contains this value",
-                    0.0, False, element_id, "type", time.time()
-                )
+                return self._type_result(web_element, element_id, None, start_time)
             
             # Clear and type new value
             selenium_element.clear()
@@ -275,168 +507,311 @@ class WebActionExecutor:
             readable_value = self._get_appropriate_value(web_element, value)
             
             selenium_element.send_keys(readable_value)
-            time.sleep(0.3)
+            self._wait_for_settle()
             
-            if self.debug:
-                print(f"✅ Successfully typed '{readable_value}' into '{element_id}'")
-            
-            # High reward for filling required fields
-            reward = 2.0 if web_element.is_required else 1.0
-            
-            return self._create_result(
-                ActionResult.SUCCESS,
-                f"Typed '{readable_value}' into '{element_id}'",
-                reward, True, element_id, "type", time.time()
-            )
+            return self._type_result(web_element, element_id, readable_value, start_time)
             
+        except StaleElementReferenceException:
+            raise  # Retried with a fresh lookup by execute_action
         except Exception as e:
-            return self._create_result(
-                ActionResult.FAILED,
-                f"Type action failed: {str(e)}",
-                -0.2, False, element_id, "type", time.time()
-            )
+            return self._failed_result(element_id, "type", e, start_time)
     
-    def _execute_select(self, web_element, element_id: str, value: str) -> ExecutionResult:
+    def _execute_select(self, web_element, element_id: str, value: str,
+                        start_time: float) -> ExecutionResult:
         """Execute a dropdown selection action"""
         try:
             selenium_element = self._find_selenium_element(web_element)
             if not selenium_element:
-                return self._create_result(
-                    ActionResult.ELEMENT_NOT_FOUND,
-                    f"Could not locate dropdown '{element_id}'",
-                    -0.2, False, element_id, "select", time.time()
-                )
+                return self._not_located_result(element_id, "select", start_time)
             
             # Create Select object
             select = Select(selenium_element)
             
-            # Get available options
-            options = [option.get_attribute('value') for option in select.options if option.get_attribute('value')]
+            # Get available options (read in the page - one call for all options)
+            options = self._call_page('options', selenium_element)
             
             if not options:
-                return self._create_result(
-                    ActionResult.FAILED,
-                    f"No selectable options found in '{element_id}'",
-                    -0.1, False, element_id, "select", time.time()
-                )
+                return self._select_result(web_element, element_id, None, start_time)
             
             # Choose a random option if no specific value provided
             if not value or value not in options:
-                selected_value = random.choice(options)
+                selected_value = self._rng.choice(options)
             else:
                 selected_value = value
             
             # Perform selection
             select.select_by_value(selected_value)
-            time.sleep(0.3)
-            
-            if self.debug:
-                print(f"✅ Successfully selected '{selected_value}' in '{element_id}'")
+            self._wait_for_settle()
             
-            return self._create_result(
-                ActionResult.SUCCESS,
-                f"Selected '{selected_value}' in dropdown '{element_id}'",
-                1.5, True, element_id, "select", time.time()
-            )
+            return self._select_result(web_element, element_id, selected_value, start_time)
             
+        except StaleElementReferenceException:
+            raise  # Retried with a fresh lookup by execute_action
         except Exception as e:
-            return self._create_result(
-                ActionResult.FAILED,
-                f"Select action failed: {str(e)}",
-                -0.2, False, element_id, "select", time.time()
-            )
+            return self._failed_result(element_id, "select", e, start_time)
     
-    def _execute_check(self, web_element, element_id: str, should_check: bool) -> ExecutionResult:
+    def _execute_check(self, web_element, element_id: str, should_check: bool,
+                       start_time: float) -> ExecutionResult:
         """Execute a checkbox check/uncheck action"""
         try:
             selenium_element = self._find_selenium_element(web_element)
             if not selenium_element:
-                return self._create_result(
-                    ActionResult.ELEMENT_NOT_FOUND,
-                    f"Could not locate checkbox '{element_id}'",
-                    -0.2, False, element_id, "check", time.time()
-                )
+                return self._not_located_result(element_id, "check", start_time)
             
-            current_state = selenium_element.is_selected()
-            
-            # Check if action is needed
-            if current_state == should_check:
-                action_word = "checked" if should_check else "unchecked"
-                return self._create_result(
-                    ActionResult.ALREADY_COMPLETED,
-                    f"Checkbox '{element_id}' is already {action_word}",
-                    0.0, False, element_id, "check", time.time()
-                )
-            
-            # Perform the action
-            selenium_element.click()
-            time.sleep(0.3)
-            
-            action_word = "checked" if should_check else "unchecked"
-            if self.debug:
-                print(f"✅ Successfully {action_word} '{element_id}'")
-            
-            # High reward for checking required checkboxes
-            reward = 2.0 if web_element.is_required and should_check else 1.0
+            # Read, compare and click in one call, so the state can't change in between
+            # (skipped entirely when the detector already saw the wanted state)
+            if web_element.is_checked == should_check:
+                outcome = None
+            else:
+                outcome = self._call_page('toggle', selenium_element, should_check)
+                if outcome['changed'] and outcome['checked'] == should_check:
+                    self._wait_for_settle()
             
-            return self._create_result(
-                ActionResult.SUCCESS,
-                f"Successfully {action_word} '{element_id}'",
-                reward, True, element_id, "check", time.time()
-            )
+            return self._check_result(web_element, element_id, should_check, outcome, start_time)
             
+        except StaleElementReferenceException:
+            raise  # Retried with a fresh lookup by execute_action
         except Exception as e:
-            return self._create_result(
-                ActionResult.FAILED,
-                f"Checkbox action failed: {str(e)}",
-                -0.2, False, element_id, "check", time.time()
-            )
+            return self._failed_result(element_id, "check", e, start_time)
     
-    def _execute_clear(self, web_element, element_id: str) -> ExecutionResult:
+    def _execute_clear(self, web_element, element_id: str, start_time: float) -> ExecutionResult:
         """Execute a clear action"""
         try:
             selenium_element = self._find_selenium_element(web_element)
             if not selenium_element:
-                return self._create_result(
-                    ActionResult.ELEMENT_NOT_FOUND,
-                    f"Could not locate element '{element_id}'",
-                    -0.2, False, element_id, "clear", time.time()
-                )
+                return self._not_located_result(element_id, "clear", start_time)
             
-            # Check if already empty
-            current_value = selenium_element.get_attribute('value') or ""
+            # Check if already empty (using the value seen by the detector)
+            current_value = self._current_value(web_element, selenium_element)
             if not current_value.strip():
-                return self._create_result(
-                    ActionResult.ALREADY_COMPLETED,
-                    f"Field '{element_id}' is already empty",
-                    0.0, False, element_id, "clear", time.time()
-                )
+                return self._clear_result(web_element, element_id, False, start_time)
             
             # Clear the field
             selenium_element.clear()
-            time.sleep(0.2)
+            self._wait_for_settle()
             
-            if self.debug:
-                print(f"✅ Successfully cleared '{element_id}'")
+            return self._clear_result(web_element, element_id, True, start_time)
             
+        except StaleElementReferenceException:
+            raise  # Retried with a fresh lookup by execute_action
+        except Exception as e:
+            return self._failed_result(element_id, "clear", e, start_time)
+    
+    # Outcome -> ExecutionResult, shared by the single actions and execute_batch
+    # (they also keep the element record in step with the page)
+    
+    NOT_LOCATED_MESSAGES = {
+        'click': "Could not locate element '{}' on page",
+        'type': "Could not locate input '{}'",
+        'select': "Could not locate dropdown '{}'",
+        'check': "Could not locate checkbox '{}'",
+        'clear': "Could not locate element '{}'",
+    }
+    
+    FAILED_MESSAGES = {
+        'click': "Click failed: {}",
+        'type': "Type action failed: {}",
+        'select': "Select action failed: {}",
+        'check': "Checkbox action failed: {}",
+        'clear': "Clear action failed: {}",
+    }
+    
+    def _not_located_result(self, element_id: str, action_type: str,
+                            start_time: float) -> ExecutionResult:
+        """The element isn't on the page (any more)"""
+        return self._create_result(
+            ActionResult.ELEMENT_NOT_FOUND,
+            self.NOT_LOCATED_MESSAGES[action_type].format(element_id),
+            -0.2, False, element_id, action_type, start_time
+        )
+    
+    def _failed_result(self, element_id: str, action_type: str, error,
+                       start_time: float) -> ExecutionResult:
+        """The action raised an error in the browser"""
+        return self._create_result(
+            ActionResult.FAILED,
+            self.FAILED_MESSAGES[action_type].format(str(error)),
+            -0.2, False, element_id, action_type, start_time
+        )
+    
+    def _click_result(self, web_element, element_id: str, outcome: str,
+                      start_time: float) -> ExecutionResult:
+        """Result of a page-side click: 'clicked', 'disabled' or 'intercepted'"""
+        if outcome == 'disabled':
             return self._create_result(
-                ActionResult.SUCCESS,
-                f"Cleared field '{element_id}'",
-                0.5, True, element_id, "clear", time.time()
+                ActionResult.ELEMENT_NOT_INTERACTABLE,
+                f"Element '{element_id}' is not clickable",
+                -0.1, False, element_id, "click", start_time
             )
-            
-        except Exception as e:
+        
+        if outcome == 'intercepted':
+            return self._create_result(
+                ActionResult.ELEMENT_NOT_INTERACTABLE,
+                f"Click on '{element_id}' was intercepted",
+                -0.1, False, element_id, "click", start_time
+            )
+        
+        if self.debug:
+            print(f"✅ Successfully clicked '{element_id}'")
+        
+        # Calculate reward based on element type
+        reward = self._calculate_click_reward(web_element)
+        
+        return self._create_result(
+            ActionResult.SUCCESS,
+            f"Clicked '{element_id}' successfully",
+            reward, True, element_id, "click", start_time
+        )
+    
+    def _type_result(self, web_element, element_id: str, typed_value: Optional[str],
+                     start_time: float) -> ExecutionResult:
+        """Result of typing typed_value (None: the field already had the text)"""
+        if typed_value is None:
+            return self._create_result(
+                ActionResult.ALREADY_COMPLETED,
+                f"Field '{element_id}' already contains this value",
+                0.0, False, element_id, "type", start_time
+            )
+        
+        web_element.value = typed_value
+        
+        if self.debug:
+            print(f"✅ Successfully typed '{typed_value}' into '{element_id}'")
+        
+        # High reward for filling required fields
+        reward = 2.0 if web_element.is_required else 1.0
+        
+        return self._create_result(
+            ActionResult.SUCCESS,
+            f"Typed '{typed_value}' into '{element_id}'",
+            reward, True, element_id, "type", start_time
+        )
+    
+    def _select_result(self, web_element, element_id: str, selected_value: Optional[str],
+                       start_time: float) -> ExecutionResult:
+        """Result of selecting selected_value (None: the dropdown had no options)"""
+        if selected_value is None:
             return self._create_result(
                 ActionResult.FAILED,
-                f"Clear action failed: {str(e)}",
-                -0.2, False, element_id, "clear", time.time()
+                f"No selectable options found in '{element_id}'",
+                -0.1, False, element_id, "select", start_time
+            )
+        
+        web_element.value = selected_value
+        
+        if self.debug:
+            print(f"✅ Successfully selected '{selected_value}' in '{element_id}'")
+        
+        return self._create_result(
+            ActionResult.SUCCESS,
+            f"Selected '{selected_value}' in dropdown '{element_id}'",
+            1.5, True, element_id, "select", start_time
+        )
+    
+    def _check_result(self, web_element, element_id: str, should_check: bool,
+                      outcome: Optional[Dict[str, Any]], start_time: float) -> ExecutionResult:
+        """Result of a page-side toggle ({changed, checked}; None: it wasn't needed)"""
+        action_word = "checked" if should_check else "unchecked"
+        
+        changed = False
+        if outcome is not None:
+            web_element.is_checked = outcome['checked']
+            changed = outcome['changed']
+        
+        # Check if action was needed
+        if not changed:
+            return self._create_result(
+                ActionResult.ALREADY_COMPLETED,
+                f"Checkbox '{element_id}' is already {action_word}",
+                0.0, False, element_id, "check", start_time
             )
+        
+        if web_element.is_checked != should_check:
+            return self._create_result(
+                ActionResult.ELEMENT_NOT_INTERACTABLE,
+                f"Checkbox '{element_id}' did not change when clicked",
+                -0.1, False, element_id, "check", start_time
+            )
+        
+        if self.debug:
+            print(f"✅ Successfully {action_word} '{element_id}'")
+        
+        # High reward for checking required checkboxes
+        reward = 2.0 if web_element.is_required and should_check else 1.0
+        
+        return self._create_result(
+            ActionResult.SUCCESS,
+            f"Successfully {action_word} '{element_id}'",
+            reward, True, element_id, "check", start_time
+        )
+    
+    def _clear_result(self, web_element, element_id: str, cleared: bool,
+                      start_time: float) -> ExecutionResult:
+        """Result of clearing a field (cleared False: it was already empty)"""
+        if not cleared:
+            return self._create_result(
+                ActionResult.ALREADY_COMPLETED,
+                f"Field '{element_id}' is already empty",
+                0.0, False, element_id, "clear", start_time
+            )
+        
+        web_element.value = ""
+        
+        if self.debug:
+            print(f"✅ Successfully cleared '{element_id}'")
+        
+        return self._create_result(
+            ActionResult.SUCCESS,
+            f"Cleared field '{element_id}'",
+            0.5, True, element_id, "clear", start_time
+        )
+    
+    def _current_value(self, web_element, selenium_element) -> str:
+        """The field's value from the last detection, read from the page only if unknown"""
+        if web_element.value is not None:
+            return web_element.value
+        return selenium_element.get_attribute('value') or ""
+    
+    def _call_page(self, method: str, *args):
+        """
+        Run one of the EXECUTOR_JS helpers in the page.
+        
+        The helpers are installed on first use and again whenever the page
+        has lost them (navigation, refresh, a recycled tab).
+        """
+        result = self.driver.execute_script(self.CALL_EXECUTOR_JS, method, *args)
+        if result is None:
+            self.driver.execute_script(self.EXECUTOR_JS)
+            result = self.driver.execute_script(self.CALL_EXECUTOR_JS, method, *args)
+        return result
+    
+    def _wait_for_settle(self, timeout: float = 0.5):
+        """
+        Wait until the page stops changing after an action
+        
+        Returns as soon as the DOM has been quiet for a short moment,
+        or after `timeout` seconds at the latest.
+        """
+        try:
+            settled = self.driver.execute_async_script(
+                self.SETTLE_CALL_JS, self.SETTLE_QUIET_MS, int(timeout * 1000)
+            )
+            if settled is None:
+                self.driver.execute_script(self.EXECUTOR_JS)
+                self.driver.execute_async_script(
+                    self.SETTLE_CALL_JS, self.SETTLE_QUIET_MS, int(timeout * 1000)
+                )
+        except WebDriverException:
+            # The action navigated away - wait for the new page to load instead
+            try:
+                self.wait.until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+            except (TimeoutException, WebDriverException):
+                pass
     
     def _get_appropriate_value(self, web_element, suggested_value: str) -> str:
         """Get appropriate value for an element based on its type"""
-        element_type = web_element.element_type.value
-        element_id = web_element.id.lower()
-        
         # Use suggested value if it looks reasonable
         if suggested_value and '_' in suggested_value:
             clean_value = suggested_value.replace('_', ' ')
@@ -444,14 +819,22 @@ class WebActionExecutor:
                 return clean_value
         
         # Generate appropriate value based on element type
+        sample_key = self._sample_key(web_element.element_type.value, web_element.id)
+        if sample_key:
+            return self._rng.choice(self.sample_data[sample_key])
+        return suggested_value.replace('_', ' ') if suggested_value else "Sample Text"
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _sample_key(element_type: str, element_id: str) -> Optional[str]:
+        """Which sample_data list fits an element (worked out once per element)"""
         if element_type == "email_input":
-            return random.choice(self.sample_data['emails'])
-        elif "name" in element_id:
-            return random.choice(self.sample_data['names'])
+            return 'emails'
+        elif "name" in element_id.lower():
+            return 'names'
         elif element_type == "textarea":
-            return random.choice(self.sample_data['descriptions'])
-        else:
-            return suggested_value.replace('_', ' ') if suggested_value else "Sample Text"
+            return 'descriptions'
+        return None
     
     def _calculate_click_reward(self, web_element) -> float:
         """Calculate reward for clicking an element"""
@@ -468,7 +851,7 @@ class WebActionExecutor:
                       state_changed: bool, element_id: str, action_type: str, 
                       start_time: float) -> ExecutionResult:
         """Create an ExecutionResult object"""
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         
         if self.debug:
             status_emoji = "✅" if result == ActionResult.SUCCESS else "❌"
@@ -505,9 +888,19 @@ class WebActionExecutor:
             # No progress change
             return 0.0
     
+    @property
+    def successful_actions(self) -> int:
+        """Number of actions that succeeded"""
+        return self.result_counts[ActionResult.SUCCESS]
+    
+    @property
+    def failed_actions(self) -> int:
+        """Number of actions with any other outcome"""
+        return sum(self.result_counts.values()) - self.result_counts[ActionResult.SUCCESS]
+    
     def get_action_statistics(self) -> Dict[str, Any]:
         """Get statistics about executed actions"""
-        total_actions = self.successful_actions + self.failed_actions
+        total_actions = sum(self.result_counts.values())
         
         if total_actions == 0:
             return {"message": "No actions executed yet"}
@@ -517,8 +910,20 @@ class WebActionExecutor:
             "successful_actions": self.successful_actions,
             "failed_actions": self.failed_actions,
             "success_rate": (self.successful_actions / total_actions) * 100,
-            "recent_actions": self.action_history[-5:] if self.action_history else []
+            "results": {result.label: count for result, count in self.result_counts.items()},
+            "recent_actions": [self.action_history[i] for i in range(-min(5, len(self.action_history)), 0)]
         }
+    
+    # Executor method for each action type:
+    # handler(self, element, element_id, value, start_time)
+    ACTION_HANDLERS = {
+        'click': lambda self, elem, elem_id, value, t: self._execute_click(elem, elem_id, t),
+        'type': lambda self, elem, elem_id, value, t: self._execute_type(elem, elem_id, value, t),
+        'select': lambda self, elem, elem_id, value, t: self._execute_select(elem, elem_id, value, t),
+        'check': lambda self, elem, elem_id, value, t: self._execute_check(elem, elem_id, True, t),
+        'uncheck': lambda self, elem, elem_id, value, t: self._execute_check(elem, elem_id, False, t),
+        'clear': lambda self, elem, elem_id, value, t: self._execute_clear(elem, elem_id, t),
+    }
 
 # Demo function to test the Web Action Executor
 def demo_web_executor():
@@ -7,9 +7,16 @@ reinforcement learning agents with Selenium WebDriver.
 """
 
 import time
-from typing import Dict, List, Tuple, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any
 from src.environment.element_detector import ElementDetector
-from src.environment.web_action_executor import WebActionExecutor
+from src.environment.web_action_executor import WebActionExecutor, ActionResult
+
+class Observation(NamedTuple):
+    """What the agent sees after a reset or step"""
+    elements: List[Any]         # Detected WebElements
+    form_state: Dict[str, Any]  # Form progress, completion and success
+    step_count: int             # Steps taken so far this episode
 
 class WebEnvironment:
     """
@@ -41,7 +48,7 @@ class WebEnvironment:
         self.episode_steps = 0
         self.max_steps = 50
         
-    def reset(self) -> Dict[str, Any]:
+    def reset(self) -> Observation:
         """
         Reset environment to initial state
         
@@ -62,11 +69,12 @@ class WebEnvironment:
         
         # Reset episode state
         self.episode_steps = 0
+        self.current_state = None
         
         # Get initial observation
         return self._get_observation()
     
-    def step(self, action: str) -> Tuple[Dict[str, Any], float, bool, Dict[str, Any]]:
+    def step(self, action: str) -> Tuple[Observation, float, bool, Dict[str, Any]]:
         """
         Execute an action and return the result
         
@@ -78,49 +86,56 @@ class WebEnvironment:
         """
         self.episode_steps += 1
         
-        # Get current elements
-        elements = self.detector.detect_elements()
+        # The elements seen by the last observation are the current ones
+        if self.current_state is not None:
+            elements = self.current_state.elements
+        else:
+            elements = self.detector.detect_elements()
         
         # Execute the action
         result = self.executor.execute_action(action, elements)
         
-        # Get new observation
-        observation = self._get_observation()
+        # Get new observation (a quick refresh of the known elements)
+        observation = self._get_observation(elements)
         
         # Calculate reward
         reward = result.reward
         
         # Check if episode is done
         done = (
-            observation['form_state']['success'] or  # Success achieved
+            observation.form_state['success'] or  # Success achieved
             self.episode_steps >= self.max_steps or  # Max steps reached
-            result.result.value == 'error'  # Error occurred
+            result.result == ActionResult.FAILED  # Error occurred
         )
         
         # Additional info
         info = {
-            'action_result': result.result.value,
+            'action_result': result.result.label,
             'steps': self.episode_steps,
-            'form_progress': observation['form_state']['progress']
+            'form_progress': observation.form_state['progress']
         }
         
         return observation, reward, done, info
     
-    def _get_observation(self) -> Dict[str, Any]:
+    def _get_observation(self, elements: List[Any] = None) -> Observation:
         """
         Get current observation of the environment
         
+        Args:
+            elements: Elements from the previous observation, if any. They are
+                refreshed in place of a full page scan when the page
+                structure hasn't changed.
+        
         Returns:
-            Dictionary containing current state information
+            Observation of the current state
         """
-        elements = self.detector.detect_elements()
-        form_state = self.detector.get_form_completion_state()
+        if elements:
+            elements, form_state = self.detector.refresh_elements_and_state(elements)
+        else:
+            elements, form_state = self.detector.detect_elements_and_state()
         
-        return {
-            'elements': elements,
-            'form_state': form_state,
-            'step_count': self.episode_steps
-        }
+        self.current_state = Observation(elements, form_state, self.episode_steps)
+        return self.current_state
     
     def close(self):
         """
@@ -128,3 +143,79 @@ class WebEnvironment:
         """
         if self.detector:
             self.detector.close()
+
+
+class VecWebEnvironment:
+    """
+    Several WebEnvironments stepped side by side
+    
+    Each environment has its own browser. Steps run in a thread per
+    environment: the time goes into waiting on the browsers, which
+    threads overlap well, and observations (which hold live Selenium
+    elements) never have to be copied between processes.
+    """
+    
+    def __init__(self, target_url: str, num_envs: int = 2, debug: bool = False):
+        """
+        Initialize the environments
+        
+        Args:
+            target_url: URL of the webpage to interact with
+            num_envs: How many environments (browsers) to run
+            debug: Enable debug output
+        """
+        self.target_url = target_url
+        self.envs = [WebEnvironment(target_url, debug=debug) for _ in range(max(1, num_envs))]
+        self._pool = ThreadPoolExecutor(max_workers=len(self.envs))
+    
+    @property
+    def num_envs(self) -> int:
+        """Number of environments"""
+        return len(self.envs)
+    
+    def reset(self) -> List[Observation]:
+        """
+        Reset every environment
+        
+        Returns:
+            Initial observation of each environment
+        """
+        return list(self._pool.map(lambda env: env.reset(), self.envs))
+    
+    def reset_env(self, index: int) -> Observation:
+        """Reset a single environment (e.g. after its episode ended)"""
+        return self.envs[index].reset()
+    
+    def step_async(self, index: int, action: str) -> Future:
+        """
+        Start executing an action in one environment without waiting
+        
+        Returns:
+            Future resolving to that environment's (observation, reward, done, info)
+        """
+        return self._pool.submit(self.envs[index].step, action)
+    
+    def step(self, actions: List[Optional[str]]) -> List[Optional[Tuple[Observation, float, bool, Dict[str, Any]]]]:
+        """
+        Execute one action in each environment at the same time
+        
+        Args:
+            actions: One action per environment; None leaves that environment idle
+            
+        Returns:
+            One (observation, reward, done, info) tuple per environment,
+            or None for the idle ones
+        """
+        futures = [
+            self._pool.submit(env.step, action) if action is not None else None
+            for env, action in zip(self.envs, actions)
+        ]
+        return [future.result() if future is not None else None for future in futures]
+    
+    def close(self):
+        """
+        Clean up all environments
+        """
+        self._pool.shutdown(wait=True)
+        for env in self.envs:
+            env.close()
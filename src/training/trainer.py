@@ -8,9 +8,20 @@ the agent, environment, and training process.
 
 import time
 import json
-from typing import Dict, Any, List
+import queue
+import threading
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, plain json works too
+    orjson = None
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Dict, Any, List, Optional, Union
 from src.agents.q_learning_agent import QLearningAgent
-from src.environment.web_environment import WebEnvironment
+from src.environment.web_environment import WebEnvironment, VecWebEnvironment
 
 class Trainer:
     """
@@ -20,28 +31,62 @@ class Trainer:
     """
     
     def __init__(self, 
-                 environment: WebEnvironment,
+                 environment: Union[WebEnvironment, VecWebEnvironment],
                  agent: QLearningAgent,
                  max_episodes: int = 100,
+                 eval_interval: Optional[int] = None,
+                 learn_batch_size: int = 1,
+                 log_file: Optional[str] = None,
                  debug: bool = False):
         """
         Initialize the trainer
         
         Args:
-            environment: Web environment to train in
+            environment: Web environment to train in (a VecWebEnvironment
+                         plays one episode per browser at the same time)
             agent: RL agent to train
             max_episodes: Maximum number of training episodes
+            eval_interval: Every this many episodes, play one greedy episode
+                           with a copy of the agent in a separate browser,
+                           without pausing training (None = off)
+            learn_batch_size: Learn from this many steps at a time in one
+                              batched update (1 = learn after every step)
+            log_file: Append one JSON line per episode to this file; the
+                      console then only shows every 10th episode
             debug: Enable debug output
         """
         self.environment = environment
         self.agent = agent
         self.max_episodes = max_episodes
+        self.learn_batch_size = max(1, learn_batch_size)
+        self.log_file = log_file
+        self._log_fh = None
         self.debug = debug
         
-        # Training statistics
-        self.episode_rewards = []
-        self.episode_lengths = []
-        self.success_episodes = []
+        # Training statistics: one slot per episode, the first
+        # episodes_done slots are filled in
+        self.episode_rewards = np.zeros(max_episodes, dtype=np.float64)
+        self.episode_lengths = np.zeros(max_episodes, dtype=np.int32)
+        self.success_episodes = np.zeros(max_episodes, dtype=np.bool_)
+        self.episodes_done = 0
+        
+        # Running totals, so the summary doesn't re-add every episode
+        self._reward_sum = 0.0
+        self._length_sum = 0
+        self._success_count = 0
+        self._best_reward = None
+        
+        # Rolling window of the last 10 episodes with running sums
+        self._recent_rewards = deque(maxlen=10)
+        self._recent_rewards_sum = 0.0
+        self._recent_successes = deque(maxlen=10)
+        self._recent_successes_sum = 0
+        
+        # Evaluation runs in a background thread, fed agent snapshots
+        self.eval_interval = eval_interval
+        self.eval_results = []
+        self._eval_queue = queue.Queue(maxsize=1)
+        self._eval_thread = None
         
     def train(self) -> Dict[str, Any]:
         """
@@ -52,24 +97,221 @@ class Trainer:
         """
         print(f"🚀 Starting training for {self.max_episodes} episodes...")
         
-        for episode in range(self.max_episodes):
-            episode_reward, episode_length, success = self._run_episode(episode + 1)
+        if self.eval_interval:
+            self._eval_thread = threading.Thread(target=self._eval_worker, daemon=True)
+            self._eval_thread.start()
+        
+        try:
+            if self.log_file:
+                self._log_fh = open(self.log_file, 'ab')
             
-            # Record statistics
-            self.episode_rewards.append(episode_reward)
-            self.episode_lengths.append(episode_length)
-            self.success_episodes.append(success)
+            if isinstance(self.environment, VecWebEnvironment):
+                self._train_vectorized()
+            else:
+                for episode in range(self.max_episodes):
+                    episode_reward, episode_length, success = self._run_episode(episode + 1)
+                    self._record_episode(episode, episode_reward, episode_length, success)
+        finally:
+            # Let the last evaluation finish
+            if self._eval_thread is not None:
+                self._stop_eval_thread()
             
-            # Print progress
-            if self.debug or episode % 10 == 0:
-                avg_reward = sum(self.episode_rewards[-10:]) / min(10, len(self.episode_rewards))
-                success_rate = sum(self.success_episodes[-10:]) / min(10, len(self.success_episodes))
-                print(f"Episode {episode + 1}: Reward={episode_reward:.2f}, "
-                      f"Avg={avg_reward:.2f}, Success={success_rate:.1%}")
+            if self._log_fh is not None:
+                self._log_fh.close()
+                self._log_fh = None
         
         # Training completed
         return self._get_training_stats()
     
+    def _record_episode(self, episode: int, episode_reward: float, episode_length: int, success: bool):
+        """Record statistics for a finished episode and print progress"""
+        self.episode_rewards[self.episodes_done] = episode_reward
+        self.episode_lengths[self.episodes_done] = episode_length
+        self.success_episodes[self.episodes_done] = success
+        self.episodes_done += 1
+        
+        self._reward_sum += episode_reward
+        self._length_sum += episode_length
+        self._success_count += int(success)
+        if self._best_reward is None or episode_reward > self._best_reward:
+            self._best_reward = episode_reward
+        
+        # Update rolling windows
+        if len(self._recent_rewards) == self._recent_rewards.maxlen:
+            self._recent_rewards_sum -= self._recent_rewards[0]
+            self._recent_successes_sum -= self._recent_successes[0]
+        self._recent_rewards.append(episode_reward)
+        self._recent_rewards_sum += episode_reward
+        self._recent_successes.append(int(success))
+        self._recent_successes_sum += int(success)
+        
+        avg_reward = self._recent_rewards_sum / len(self._recent_rewards)
+        if self._log_fh is not None:
+            self._write_log({'episode': episode + 1, 'reward': float(episode_reward),
+                             'length': int(episode_length), 'success': bool(success),
+                             'avg_reward': avg_reward})
+        
+        # Print progress
+        if (self.debug and self._log_fh is None) or episode % 10 == 0:
+            success_rate = self._recent_successes_sum / len(self._recent_successes)
+            print(f"Episode {episode + 1}: Reward={episode_reward:.2f}, "
+                  f"Avg={avg_reward:.2f}, Success={success_rate:.1%}")
+        
+        if self._eval_thread is not None and self.episodes_done % self.eval_interval == 0:
+            try:
+                self._eval_queue.put_nowait((self.episodes_done, self.agent.snapshot()))
+            except queue.Full:
+                pass  # Previous evaluation still running; skip this one
+    
+    def _write_log(self, record: Dict[str, Any]):
+        """Append a record to the log file as one line of JSON"""
+        if orjson is not None:
+            self._log_fh.write(orjson.dumps(record) + b'\n')
+        else:
+            self._log_fh.write(json.dumps(record, separators=(',', ':')).encode() + b'\n')
+    
+    def _stop_eval_thread(self):
+        """Tell the evaluation thread to stop once it's done, and wait for it"""
+        while self._eval_thread.is_alive():
+            try:
+                self._eval_queue.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue  # Still evaluating the last snapshot
+        self._eval_thread.join()
+        self._eval_thread = None
+    
+    def _eval_worker(self):
+        """
+        Evaluate queued agent snapshots until None arrives
+        
+        Uses its own browser, so evaluation overlaps with training
+        instead of stalling it.
+        """
+        environment = WebEnvironment(self.environment.target_url)
+        try:
+            while True:
+                item = self._eval_queue.get()
+                if item is None:
+                    break
+                
+                episodes_done, agent = item
+                try:
+                    reward, length, success = self._run_eval_episode(environment, agent)
+                except Exception as e:
+                    print(f"⚠️ Evaluation after episode {episodes_done} failed: {e}")
+                    continue
+                
+                self.eval_results.append({
+                    'episode': episodes_done,
+                    'reward': reward,
+                    'length': length,
+                    'success': success
+                })
+                print(f"📏 Eval after episode {episodes_done}: Reward={reward:.2f}, "
+                      f"Steps={length}, Success={success}")
+        finally:
+            environment.close()
+    
+    @staticmethod
+    def _run_eval_episode(environment: WebEnvironment, agent: QLearningAgent) -> tuple[float, int, bool]:
+        """Play one episode with a (greedy) agent snapshot, without learning"""
+        observation = environment.reset()
+        state, possible_actions = agent.analyze(observation.elements, observation.form_state)
+        
+        total_reward = 0
+        step_count = 0
+        done = False
+        
+        while not done and possible_actions:
+            action = agent.choose_action(state, possible_actions)
+            observation, reward, done, info = environment.step(action)
+            state, possible_actions = agent.analyze(observation.elements, observation.form_state)
+            total_reward += reward
+            step_count += 1
+        
+        return total_reward, step_count, observation.form_state['success']
+    
+    def _train_vectorized(self):
+        """
+        Run episodes in all environments of a VecWebEnvironment at once
+        
+        Environments don't wait for each other: as soon as one finishes a
+        step, the agent picks its next action (together with any others that
+        finished meanwhile) and sends it off, while the remaining browsers
+        are still busy. The agent's work is thus hidden behind browser time.
+        When an environment's episode ends its transitions are learned (in
+        one block, so the agent's per-episode bookkeeping stays intact) and
+        the environment starts the next episode.
+        """
+        vec_env = self.environment
+        observations = vec_env.reset()
+        started = min(vec_env.num_envs, self.max_episodes)
+        states = [None] * vec_env.num_envs
+        possible_actions = [None] * vec_env.num_envs
+        actions = [None] * vec_env.num_envs
+        transitions = [[] for _ in range(vec_env.num_envs)]
+        pending = {}  # step future -> environment index
+        ready = list(range(started))
+        finished = 0
+        
+        while ready or pending:
+            # Decide: one action per environment that is waiting, chosen together
+            for i in ready:
+                if states[i] is None:  # First step; later ones carry over from the last step
+                    states[i], possible_actions[i] = self.agent.analyze(observations[i].elements,
+                                                                        observations[i].form_state)
+            chosen = self.agent.choose_actions_batch([states[i] for i in ready],
+                                                     [possible_actions[i] for i in ready])
+            
+            # Act: send each action off without waiting for it
+            finished_envs = []
+            for i, action in zip(ready, chosen):
+                actions[i] = action
+                if action is None:
+                    # Nothing left to do on this page - the episode is over
+                    finished_envs.append(i)
+                else:
+                    pending[vec_env.step_async(i, action)] = i
+            
+            # Collect whichever steps complete first
+            ready = []
+            if pending and not finished_envs:
+                completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    i = pending.pop(future)
+                    observations[i], reward, done, info = future.result()
+                    next_state, possible_actions[i] = self.agent.analyze(observations[i].elements,
+                                                                         observations[i].form_state)
+                    transitions[i].append((states[i], actions[i], reward, next_state, done))
+                    states[i] = next_state
+                    if done:
+                        finished_envs.append(i)
+                    else:
+                        ready.append(i)
+            
+            for i in finished_envs:
+                success = observations[i].form_state['success']
+                
+                # Learn: replay the finished episode into the agent
+                self.agent.start_episode()
+                self.agent.learn_batch(transitions[i])
+                for transition in transitions[i]:
+                    self.agent.step(transition[2])
+                self.agent.end_episode(success)
+                
+                self._record_episode(finished, sum(t[2] for t in transitions[i]),
+                                     len(transitions[i]), success)
+                finished += 1
+                transitions[i] = []
+                states[i] = None
+                
+                # Start the next episode in this environment, if any are left
+                if started < self.max_episodes:
+                    observations[i] = vec_env.reset_env(i)
+                    started += 1
+                    ready.append(i)
+    
     def _run_episode(self, episode_num: int) -> tuple[float, int, bool]:
         """
         Run a single training episode
@@ -86,15 +328,13 @@ class Trainer:
         total_reward = 0
         step_count = 0
         done = False
+        transitions = []  # Waiting to be learned when learn_batch_size > 1
+        
+        # Current state and actions; later ones are carried over from the previous step
+        state, possible_actions = self.agent.analyze(observation.elements, observation.form_state)
         
         while not done:
-            # Get current state
-            elements = observation['elements']
-            form_state = observation['form_state']
-            state = self.agent.get_state_signature(elements, form_state)
-            
             # Choose action
-            possible_actions = self.agent.get_possible_actions(elements)
             if not possible_actions:
                 break
                 
@@ -103,22 +343,32 @@ class Trainer:
             # Execute action
             next_observation, reward, done, info = self.environment.step(action)
             
-            # Get next state
-            next_elements = next_observation['elements']
-            next_form_state = next_observation['form_state']
-            next_state = self.agent.get_state_signature(next_elements, next_form_state)
+            # Get next state (and the actions possible there)
+            next_state, possible_actions = self.agent.analyze(next_observation.elements,
+                                                              next_observation.form_state)
             
             # Learn from experience
-            self.agent.learn(state, action, reward, next_state, done)
+            if self.learn_batch_size == 1:
+                self.agent.learn(state, action, reward, next_state, done)
+            else:
+                transitions.append((state, action, reward, next_state, done))
+                if len(transitions) == self.learn_batch_size:
+                    self.agent.learn_batch(transitions)
+                    transitions = []
             self.agent.step(reward)
             
             # Update for next iteration
             observation = next_observation
+            state = next_state
             total_reward += reward
             step_count += 1
         
+        # Learn what's left over
+        if transitions:
+            self.agent.learn_batch(transitions)
+        
         # End episode
-        success = observation['form_state']['success']
+        success = observation.form_state['success']
         self.agent.end_episode(success)
         
         return total_reward, step_count, success
@@ -127,17 +377,18 @@ class Trainer:
         """
         Get comprehensive training statistics
         """
-        total_episodes = len(self.episode_rewards)
-        total_successes = sum(self.success_episodes)
+        total_episodes = self.episodes_done
+        total_successes = self._success_count
         
         return {
             'total_episodes': total_episodes,
             'total_successes': total_successes,
             'success_rate': total_successes / total_episodes if total_episodes > 0 else 0,
-            'average_reward': sum(self.episode_rewards) / total_episodes if total_episodes > 0 else 0,
-            'best_reward': max(self.episode_rewards) if self.episode_rewards else 0,
-            'average_episode_length': sum(self.episode_lengths) / total_episodes if total_episodes > 0 else 0,
-            'episode_rewards': self.episode_rewards,
-            'episode_lengths': self.episode_lengths,
-            'success_episodes': self.success_episodes
+            'average_reward': self._reward_sum / total_episodes if total_episodes > 0 else 0,
+            'best_reward': self._best_reward if self._best_reward is not None else 0,
+            'average_episode_length': self._length_sum / total_episodes if total_episodes > 0 else 0,
+            'episode_rewards': self.episode_rewards[:total_episodes].tolist(),
+            'episode_lengths': self.episode_lengths[:total_episodes].tolist(),
+            'success_episodes': self.success_episodes[:total_episodes].tolist(),
+            'eval_results': list(self.eval_results)
         }
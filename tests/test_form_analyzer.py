@@ -0,0 +1,36 @@
+"""
+Tests for the form analyzer's HTML counter, run against the demo form
+"""
+
+from form_analyzer_fixed import _FormCounter, _HTML_PATH
+
+
+def count_demo_form() -> _FormCounter:
+    counter = _FormCounter()
+    with open(_HTML_PATH, 'r') as f:
+        counter.feed(f.read())
+    counter.close()
+    return counter
+
+
+def test_counts_demo_form_elements():
+    counter = count_demo_form()
+    
+    assert counter.counts['input'] == 4   # name, email, newsletter, terms
+    assert counter.counts['select'] == 1  # age
+    assert counter.counts['button'] == 2  # submit, reset
+
+
+def test_counts_required_attributes_only():
+    # Only real required attributes count (name, email and terms - the same
+    # fields the page's own progress check uses), not the word "required"
+    # in scripts or messages
+    assert count_demo_form().counts['required'] == 3
+
+
+def test_detects_key_fields():
+    counter = count_demo_form()
+    
+    assert counter.has_name
+    assert counter.has_email
+    assert counter.has_submit
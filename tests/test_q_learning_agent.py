@@ -0,0 +1,149 @@
+"""
+Tests for QLearningAgent that need no browser
+
+They check that the batch and snapshot paths agree with the one-at-a-time
+ones, that saved models load back (including the older pickle format),
+and that max(Q(s',a')) only looks at actions known in s'.
+"""
+
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+from src.agents.q_learning_agent import QLearningAgent
+
+
+STATES = ["s0", "s1", "s2", "s3"]
+ACTIONS = ["click_a", "type_b", "select_c", "check_d", "submit_e"]
+
+
+def make_agent(**kwargs) -> QLearningAgent:
+    kwargs.setdefault("debug", False)
+    return QLearningAgent(**kwargs)
+
+
+def random_transitions(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    transitions = []
+    for _ in range(count):
+        done = rng.random() < 0.2
+        transitions.append((rng.choice(STATES), rng.choice(ACTIONS), rng.uniform(-5, 5),
+                            None if done else rng.choice(STATES), done))
+    return transitions
+
+
+def test_learn_batch_matches_learn_loop():
+    transitions = random_transitions(200)
+    one_by_one = make_agent(learning_rate=0.3, discount_factor=0.9)
+    batched = make_agent(learning_rate=0.3, discount_factor=0.9)
+
+    for transition in transitions:
+        one_by_one.learn(*transition)
+    batched.learn_batch(transitions)
+
+    assert batched.states == one_by_one.states
+    assert batched.actions == one_by_one.actions
+    expected = one_by_one.q_table
+    for state, row in batched.q_table.items():
+        assert row == pytest.approx(expected[state], abs=1e-5)
+    assert batched.experience_count == one_by_one.experience_count
+    assert np.array_equal(batched._mem_states, one_by_one._mem_states)
+    assert np.array_equal(batched._mem_next_states, one_by_one._mem_next_states)
+
+
+def test_greedy_batch_choice_matches_best_action():
+    agent = make_agent(epsilon=0.0)
+    agent.learn_batch(random_transitions(200, seed=1))
+
+    rng = random.Random(2)
+    states = [rng.choice(STATES + ["unseen"]) for _ in range(30)]
+    action_lists = [rng.sample(ACTIONS, rng.randint(1, len(ACTIONS))) for _ in states]
+    action_lists[3] = []
+
+    chosen = agent.choose_actions_batch(states, action_lists)
+
+    for state, actions, action in zip(states, action_lists, chosen):
+        if actions:
+            assert action == agent._get_best_action(state, actions)
+        else:
+            assert action is None
+
+
+def test_snapshot_picks_the_same_actions():
+    agent = make_agent(epsilon=0.0)
+    agent.learn_batch(random_transitions(200, seed=3))
+    frozen = agent.snapshot()
+
+    for state in STATES:
+        assert frozen.choose_action(state, ACTIONS) == agent.choose_action(state, ACTIONS)
+
+    # Later learning doesn't leak into the snapshot
+    before = frozen.q_table
+    agent.learn("s0", "click_a", 100.0, None, True)
+    assert frozen.q_table == before
+
+
+def test_save_and_load_round_trip(tmp_path):
+    agent = make_agent(epsilon=0.2)
+    agent.learn_batch(random_transitions(100, seed=4))
+    agent.total_episodes = 7
+    path = str(tmp_path / "model.npz")
+    agent.save_model(path)
+
+    loaded = make_agent()
+    assert loaded.load_model(path)
+
+    assert loaded.states == agent.states
+    assert loaded.actions == agent.actions
+    assert loaded.q_table == agent.q_table
+    assert loaded.epsilon == agent.epsilon
+    assert loaded.total_episodes == 7
+
+
+def test_load_old_pickle_model(tmp_path):
+    path = str(tmp_path / "old_model.pkl")
+    with open(path, "wb") as f:
+        pickle.dump({
+            "q_table": {"s0": {"click_a": 1.5, "type_b": -2.0}, "s1": {"type_b": 0.25}},
+            "learning_rate": 0.2,
+            "epsilon": 0.05,
+            "total_episodes": 12,
+            "action_counts": {"click_a": 3},
+        }, f)
+
+    agent = make_agent()
+    assert agent.load_model(path)
+
+    assert agent.q_table == {"s0": {"click_a": 1.5, "type_b": -2.0}, "s1": {"type_b": 0.25}}
+    assert agent.learning_rate == 0.2
+    assert agent.total_episodes == 12
+    assert agent.action_counts["click_a"] == 3
+
+
+def test_missing_model_file_fails_cleanly(tmp_path):
+    assert not make_agent().load_model(str(tmp_path / "missing.npz"))
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_bellman_max_ignores_unknown_actions(batched):
+    agent = make_agent(learning_rate=1.0, discount_factor=1.0)
+    transitions = [
+        # s2 only knows two actions, both bad
+        ("s2", "click_x", -5.0, None, True),
+        ("s2", "click_y", -3.0, None, True),
+        # click_z has a column but was never seen in s2 - its 0.0 mustn't count
+        ("s1", "click_z", 0.0, "s2", False),
+        # s3 knows no actions at all, so its future value is 0
+        ("s1", "click_x", 1.0, "s3", False),
+    ]
+
+    if batched:
+        agent.learn_batch(transitions)
+    else:
+        for transition in transitions:
+            agent.learn(*transition)
+
+    assert agent.get_q_value("s1", "click_z") == pytest.approx(-3.0)
+    assert agent.get_q_value("s1", "click_x") == pytest.approx(1.0)
@@ -0,0 +1,152 @@
+"""
+Tests for WebActionExecutor.execute_batch, using a fake WebDriver
+
+The fake driver answers the executor's page calls with canned outcomes,
+so no browser is needed.
+"""
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from src.environment.element_detector import ElementDetector, ElementType, WebElement
+from src.environment.web_action_executor import ActionResult, WebActionExecutor
+
+
+class FakeHandle:
+    """Stands in for a live Selenium element"""
+    
+    def __init__(self, tag_name='input'):
+        self.tag_name = tag_name
+        self.keys = []
+    
+    def get_dom_attribute(self, name):
+        return None
+    
+    def clear(self):
+        self.keys = []
+    
+    def send_keys(self, text):
+        self.keys.append(text)
+
+
+class FakeDriver:
+    """Answers window.__executor calls with outcomes given by the test"""
+    
+    def __init__(self, **outcomes):
+        self.outcomes = outcomes  # helper name -> outcome (or function of the arguments)
+        self.calls = []
+        self.settles = 0
+    
+    def execute_script(self, script, *args):
+        if script != WebActionExecutor.CALL_EXECUTOR_JS:
+            return None  # Installing the helpers
+        method = args[0]
+        self.calls.append((method, args[1:]))
+        outcome = self.outcomes[method]
+        return outcome(*args[1:]) if callable(outcome) else outcome
+    
+    def execute_async_script(self, script, *args):
+        self.settles += 1
+        return True
+
+
+def make_element(element_id, element_type=ElementType.TEXT_INPUT, required=True, value='', checked=None):
+    return WebElement(
+        id=element_id, element_type=element_type, tag_name='input', text='', placeholder='',
+        value=value, is_required=required, is_visible=True, is_enabled=True,
+        xpath='', css_selector=f'#{element_id}',
+        possible_actions=ElementDetector.ACTIONS_BY_TYPE.get(element_type, ()),
+        coordinates=(0, 0), size=(1, 1), is_checked=checked,
+        handle=FakeHandle('select' if element_type == ElementType.SELECT_DROPDOWN else 'input')
+    )
+
+
+def without_timing(result):
+    return (result.result, result.message, result.reward, result.state_changed,
+            result.element_id, result.action_type)
+
+
+def test_batch_results_match_single_actions():
+    def single_and_batch(action, element_args, single_outcomes, batch_outcome):
+        single = WebActionExecutor(FakeDriver(**single_outcomes), debug=False)
+        expected = single.execute_action(action, [make_element(*element_args)])
+        batch = WebActionExecutor(FakeDriver(batch=[batch_outcome]), debug=False)
+        result, = batch.execute_batch([action], [make_element(*element_args)])
+        assert without_timing(result) == without_timing(expected)
+    
+    button = ('go', ElementType.SUBMIT_BUTTON, False)
+    single_and_batch('click_go', button, {'click': 'clicked'}, {'status': 'clicked'})
+    single_and_batch('click_go', button, {'click': 'intercepted'}, {'status': 'intercepted'})
+    single_and_batch('click_go', button, {'click': 'disabled'}, {'status': 'disabled'})
+    
+    checkbox = ('agree', ElementType.CHECKBOX, True, '', False)
+    toggled = {'changed': True, 'checked': True}
+    single_and_batch('check_agree', checkbox, {'toggle': toggled}, dict(toggled, status='done'))
+    stuck = {'changed': True, 'checked': False}
+    single_and_batch('check_agree', checkbox, {'toggle': stuck}, dict(stuck, status='done'))
+    
+    field = ('name', ElementType.TEXT_INPUT, True, 'Jane Smith')
+    single_and_batch('type_name_Jane_Smith', field, {}, {'status': 'unchanged'})
+    single_and_batch('clear_name', field, {}, {'status': 'done'})
+    
+    dropdown = ('age', ElementType.SELECT_DROPDOWN, False)
+    single_and_batch('select_age', dropdown, {'options': []}, {'status': 'unchanged'})
+
+
+def test_batch_runs_in_one_call_and_settles_once():
+    name = make_element('name')
+    agree = make_element('agree', ElementType.CHECKBOX, checked=False)
+    driver = FakeDriver(batch=[
+        {'status': 'done', 'value': 'Jane Smith'},
+        {'status': 'done', 'changed': True, 'checked': True},
+    ])
+    executor = WebActionExecutor(driver, debug=False)
+    
+    results = executor.execute_batch(
+        ['type_name_Jane_Smith', 'check_agree', 'click_missing', 'nonsense'], [name, agree]
+    )
+    
+    assert [r.result for r in results] == [
+        ActionResult.SUCCESS, ActionResult.SUCCESS,
+        ActionResult.ELEMENT_NOT_FOUND, ActionResult.FAILED,
+    ]
+    assert [method for method, _ in driver.calls] == ['batch']
+    assert driver.settles == 1
+    
+    # The element records follow the page
+    assert name.value == 'Jane Smith'
+    assert agree.is_checked is True
+    assert executor.result_counts[ActionResult.SUCCESS] == 2
+    assert len(executor.action_history) == 4
+
+
+def test_batch_type_compares_against_requested_text():
+    driver = FakeDriver(batch=lambda steps: [{'status': 'unchanged'} for _ in steps])
+    executor = WebActionExecutor(driver, debug=False)
+    
+    executor.execute_batch(['type_name_Jane_Smith'], [make_element('name')])
+    
+    (steps,), = [args for _, args in driver.calls]
+    assert steps[0]['op'] == 'type'
+    assert steps[0]['expect'] == 'Jane Smith'
+    assert driver.settles == 0  # Nothing changed, nothing to wait for
+
+
+def test_batch_retries_stale_handles_once():
+    element = make_element('go', ElementType.BUTTON, required=False)
+    stale_handle = element.handle
+    attempts = []
+    
+    def batch(steps):
+        attempts.append(steps[0]['el'])
+        if len(attempts) == 1:
+            raise StaleElementReferenceException()
+        return [{'status': 'clicked'}]
+    
+    driver = FakeDriver(batch=batch)
+    driver.find_element = lambda by, locator: FakeHandle()
+    executor = WebActionExecutor(driver, debug=False)
+    
+    result, = executor.execute_batch(['click_go'], [element])
+    
+    assert result.result == ActionResult.SUCCESS
+    assert attempts[0] is stale_handle and attempts[1] is not stale_handle